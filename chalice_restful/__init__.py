@@ -1,3 +1,14 @@
 from .core import Api, Resource, route, cors, api_key_required
-from .configs import config, flag, only_classes, only_functions
-from .authorization import authorizer
+from .configs import config, flag, only_classes, only_functions, route_option
+from .authorization import Jwks, authorizer, token_authorizer
+from .endpoints import Endpoint
+from .caching import cached
+from .coalescing import coalesce
+from .instrumentation import EmbeddedMetrics, Histogram, Measurement
+from .validation import body
+from .pagination import paginated
+from .serialization import encode_json
+from .compression import compress
+from .rate_limiting import LocalBuckets, rate_limit
+from .timeouts import Deadline, timeout
+from .idempotency import idempotent
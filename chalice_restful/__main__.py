@@ -0,0 +1,84 @@
+"""Exports and checks routes of an API before it's deployed.
+
+Usage:
+    python -m chalice_restful export app.resources --format openapi
+    python -m chalice_restful check app.resources
+
+The target is either a package of resources (as passed to `Api.add_all`),
+which is scanned without registering anything in Chalice, or an `Api`
+instance in the `module:name` format, e.g. `app:api`.
+
+Once `check` passes at build time, runtime validation can be disabled
+in production with the `CHALICE_RESTFUL_STRICT=0` environment variable.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from importlib import import_module
+from typing import List, Tuple
+
+from chalice_restful.analysis import AnyEndpoint, describe, openapi, problems
+from chalice_restful.core import Api, Resource
+from chalice_restful.discovery import scan
+from chalice_restful.endpoints import resolve
+
+
+def endpoints(target: str) -> Tuple[List[AnyEndpoint], List[str]]:
+    """Resolves endpoints of a package or an `Api` instance.
+
+    Endpoints of an `Api` include the ones added lazily (e.g. from
+    a manifest), whose resources aren't imported.
+
+    Returns:
+        Endpoints and names of the resources that have none.
+    """
+
+    module, _, name = target.partition(':')
+
+    if name:
+        api = getattr(import_module(module), name)
+        return api.endpoints + api.lazy_endpoints, []
+
+    resolved, empty = [], []
+
+    for x in scan(module, base=Resource):
+        found = resolve(x, Api.supported_methods)
+        if not found:
+            empty.append(f'{x.__module__}:{x.__qualname__}')
+        resolved += found
+
+    return resolved, empty
+
+
+def main(args: List[str] = None) -> int:
+    parser = ArgumentParser(prog='chalice_restful', description=__doc__)
+    parser.add_argument('command', choices=['export', 'check'])
+    parser.add_argument('target',
+                        help='package of resources or `module:api`')
+    parser.add_argument('--format', choices=['json', 'openapi'],
+                        default='json', help='format of the export')
+    parser.add_argument('--title', default='API',
+                        help='title of the OpenAPI document')
+    args = parser.parse_args(args)
+
+    resolved, empty = endpoints(args.target)
+    found = [f'Resource without endpoints: {x}' for x in empty] + \
+        problems(resolved)
+
+    if args.command == 'export':
+        if args.format == 'openapi':
+            document = openapi(resolved, args.title)
+        else:
+            document = [describe(x) for x in resolved]
+
+        print(json.dumps(document, indent=2))
+
+    for x in found:
+        print(x, file=sys.stderr)
+
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
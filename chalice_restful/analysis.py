@@ -0,0 +1,135 @@
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from chalice_restful.endpoints import Endpoint, LazyEndpoint
+
+AnyEndpoint = Union[Endpoint, LazyEndpoint]
+
+
+def describe(endpoint: AnyEndpoint) -> Dict[str, Any]:
+    """Describes the endpoint as a JSON serializable dictionary.
+
+    Options that aren't JSON serializable are described by their name
+    (e.g. an `authorizer`) or their representation.
+    """
+
+    module, name = _location(endpoint)
+
+    return {'resource': f'{module}:{name}',
+            'path': endpoint.path,
+            'method': endpoint.method,
+            'options': {k: _describe(v)
+                        for k, v in endpoint.route_options.items()}}
+
+
+def problems(endpoints: Iterable[AnyEndpoint]) -> List[str]:
+    """Finds routing mistakes among the endpoints.
+
+    These are:
+        a) the same HTTP-method of the same path defined more than once;
+        b) path parameters of different names at the same position
+           of the same parent path, e.g. `/items/{id}` and `/items/{name}`,
+           which API Gateway rejects.
+    """
+
+    endpoints = list(endpoints)
+    found = []
+
+    counts = Counter((x.path, x.method) for x in endpoints)
+    for (path, method), count in counts.items():
+        if count > 1:
+            found.append(f'Duplicate route: {method} {path} '
+                         f'is defined {count} times')
+
+    names = defaultdict(dict)
+    for path in dict.fromkeys(x.path for x in endpoints):
+        parent = ()
+
+        for x in path.strip('/').split('/'):
+            if _is_param(x):
+                names[parent].setdefault(x, path)
+                x = '{}'
+
+            parent += (x,)
+
+    for parent, params in names.items():
+        if len(params) > 1:
+            found.append('Conflicting path parameters: ' +
+                         ' and '.join(f'{k} in {v}' for k, v in params.items()))
+
+    return found
+
+
+def openapi(endpoints: Iterable[AnyEndpoint], title: str,
+            version: str = '1.0.0') -> Dict[str, Any]:
+    """Builds an OpenAPI 3 document of the endpoints.
+
+    Only the routing is described: paths, HTTP-methods, path parameters
+    and security requirements of the `api_key_required` and `authorizer`
+    options. Bodies and responses aren't.
+    """
+
+    paths = defaultdict(dict)
+    schemes = {}
+
+    for x in endpoints:
+        name = _location(x)[1].rpartition('.')[2]
+        operation = {
+            'operationId': f'{name}.{x.name}',
+            'responses': {'default': {'description': 'Response'}},
+        }
+
+        parameters = [{'name': s[1:-1], 'in': 'path', 'required': True,
+                       'schema': {'type': 'string'}}
+                      for s in x.path.split('/') if _is_param(s)]
+        if parameters:
+            operation['parameters'] = parameters
+
+        security = {}
+        if x.route_options.get('api_key_required'):
+            security['api_key'] = []
+            schemes['api_key'] = {'type': 'apiKey', 'name': 'x-api-key',
+                                  'in': 'header'}
+
+        authorizer = x.route_options.get('authorizer')
+        if authorizer:
+            name = _describe(authorizer)
+            security[name] = []
+            schemes[name] = {'type': 'apiKey', 'name': 'Authorization',
+                             'in': 'header'}
+
+        if security:
+            operation['security'] = [security]
+
+        paths[x.path][x.method.lower()] = operation
+
+    document = {'openapi': '3.0.1',
+                'info': {'title': title, 'version': version},
+                'paths': dict(paths)}
+
+    if schemes:
+        document['components'] = {'securitySchemes': schemes}
+
+    return document
+
+
+def _location(endpoint: AnyEndpoint) -> Tuple[str, str]:
+    # Resources added lazily aren't imported, so only their targets are known.
+    if isinstance(endpoint, LazyEndpoint):
+        module, _, name = endpoint.target.partition(':')
+        return module, name
+
+    return endpoint.resource.__module__, endpoint.resource.__qualname__
+
+
+def _is_param(segment: str) -> bool:
+    return segment.startswith('{') and segment.endswith('}')
+
+
+def _describe(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_describe(x) for x in value]
+
+    return getattr(value, 'name', None) or repr(value)
@@ -1,9 +1,18 @@
-from chalice.app import Authorizer
+import json
+from functools import wraps
+from hashlib import sha256
+from time import monotonic, time
+from typing import Any, Callable, Dict, Optional
 
-from chalice_restful import config
+from chalice.app import Authorizer, Request, UnauthorizedError
+
+from chalice_restful.caching import LruCache
+from chalice_restful.common.guards import ensure
+from chalice_restful.configs import config, route_option
 
 
 @config
+@route_option
 def authorizer(_: Authorizer):
     """Adds an authorizer to an endpoint or a resource.
 
@@ -12,3 +21,188 @@ def authorizer(_: Authorizer):
 
     Read more: https://github.com/aws/chalice/blob/master/docs/source/topics/authorizers.rst.
     """
+
+
+class TokenAuthorizer:
+    """Verifies tokens in the Lambda, see `token_authorizer`.
+
+    Verified principals are cached by the token, so the same token
+    is verified only once per container until its cache entry expires.
+    """
+
+    def __init__(self, verify: Callable[[str], Any], ttl: float,
+                 max_entries: int, header: str):
+        self.verify = verify
+        self.ttl = ttl
+        self.header = header
+        self.principals = LruCache(max_entries, ttl)
+
+    def authorize(self, request: Request) -> Any:
+        """Returns a principal of the request.
+
+        Raises:
+            UnauthorizedError: Raised if the token is missing or invalid.
+        """
+
+        token = request.headers.get(self.header)
+        if not token:
+            raise UnauthorizedError('Missing token')
+
+        if token[:7].lower() == 'bearer ':
+            token = token[7:]
+
+        key = sha256(token.encode('utf-8')).digest()
+
+        principal = self.principals.get(key)
+        if principal is None:
+            principal = self.verify(token)
+            if principal is None:
+                raise UnauthorizedError('Invalid token')
+
+            self.principals.put(key, principal, ttl=_ttl(principal, self.ttl))
+
+        return principal
+
+
+@config
+def token_authorizer(verify: Callable[[str], Any],
+                     ttl: float = 300,
+                     max_entries: int = 1024,
+                     header: str = 'Authorization') -> TokenAuthorizer:
+    """Verifies tokens of requests to a decorated endpoint or resource.
+
+    Unlike `authorizer`, which relies on API Gateway, the `verify`
+    function is called in the Lambda itself. It accepts a token
+    (without the `Bearer` prefix) and returns a principal, e.g. claims
+    of a JWT, or `None` (or raises `UnauthorizedError`) if it's invalid:
+        def verify(token):
+            return jwt.decode(token, jwks.key(...), algorithms=['RS256'])
+
+        @route('/v1/items')
+        @token_authorizer(verify, ttl=300)
+        class Items(Resource):
+            def get(): ...
+
+    Verified principals are cached in memory by the token for `ttl`
+    seconds (but not longer than the `exp` claim of a principal,
+    if it has one), so warm containers don't verify the same token
+    again on every request.
+
+    The principal is available in `api.request.context['authorizer']`,
+    the same place API Gateway authorizers put it in.
+
+    Args:
+        verify: Function that returns a principal of a token.
+        ttl: Number of seconds a principal is cached for.
+        max_entries: Maximum number of cached principals.
+        header: Name of a header the token is read from.
+    """
+
+    ensure(ttl).is_positive()
+    ensure(max_entries).is_positive()
+
+    return TokenAuthorizer(verify, ttl, max_entries, header)
+
+
+def authorize(handler: Callable, authorizer: TokenAuthorizer,
+              request: Callable[[], Request]) -> Callable:
+    """Wraps the handler, so it's called only for authorized requests.
+
+    Args:
+        handler: Endpoint to wrap.
+        authorizer: Rules of token verification.
+        request: Function that returns an incoming HTTP-request.
+    """
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        current = request()
+        current.context['authorizer'] = authorizer.authorize(current)
+
+        return handler(*args, **kwargs)
+
+    return body
+
+
+class Jwks:
+    """A JSON Web Key Set kept in memory between invocations.
+
+    Keys are fetched from the `url` on the first use, parsed once
+    and refetched only when they expire or when an unknown key
+    is requested (e.g. after the keys are rotated):
+        jwks = Jwks('https://example.com/.well-known/jwks.json',
+                    parse=RSAAlgorithm.from_jwk)
+
+        def verify(token):
+            kid = jwt.get_unverified_header(token)['kid']
+            return jwt.decode(token, jwks.key(kid), algorithms=['RS256'])
+
+    Args:
+        url: Location of the key set.
+        ttl: Number of seconds the keys are kept for.
+        parse: Function that converts a JWK (as a JSON string)
+            to a key object, the JWK dictionary is kept by default.
+        fetch: Function that returns the key set by the `url`.
+        min_refresh: Minimum number of seconds between refetches
+            caused by unknown keys.
+    """
+
+    def __init__(self, url: str, ttl: float = 3600,
+                 parse: Callable[[str], Any] = None,
+                 fetch: Callable[[str], Dict] = None,
+                 min_refresh: float = 60,
+                 clock: Callable[[], float] = monotonic):
+        self.url = url
+        self.ttl = ttl
+        self.parse = parse
+        self.fetch = fetch or _fetch
+        self.min_refresh = min_refresh
+        self.clock = clock
+        self.keys: Dict[str, Any] = {}
+        self.fetched: Optional[float] = None
+
+    def key(self, kid: str) -> Any:
+        """Returns a parsed key by its identifier.
+
+        Raises:
+            UnauthorizedError: Raised if there is no such key.
+        """
+
+        now = self.clock()
+
+        if self.fetched is None or now - self.fetched >= self.ttl or \
+           (kid not in self.keys and now - self.fetched >= self.min_refresh):
+            self.refresh()
+
+        if kid not in self.keys:
+            raise UnauthorizedError('Unknown key')
+
+        return self.keys[kid]
+
+    def refresh(self):
+        """Fetches and parses the keys."""
+
+        keys = {}
+
+        for x in self.fetch(self.url)['keys']:
+            keys[x['kid']] = self.parse(json.dumps(x)) if self.parse else x
+
+        self.keys = keys
+        self.fetched = self.clock()
+
+
+def _ttl(principal: Any, ttl: float) -> float:
+    expires = principal.get('exp') if isinstance(principal, dict) else None
+    if not isinstance(expires, (int, float)):
+        return ttl
+
+    return min(max(expires - time(), 0), ttl)
+
+
+def _fetch(url: str) -> Dict:
+    # Imported here, since `urllib.request` is expensive to import
+    # and is only needed when keys are fetched.
+    from urllib.request import urlopen
+
+    with urlopen(url, timeout=5) as response:
+        return json.loads(response.read())
@@ -0,0 +1,136 @@
+import json
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping
+
+from chalice.app import (BadRequestError, ChaliceViewError, ForbiddenError,
+                         Request, Response)
+
+from chalice_restful.common.errors import error
+from chalice_restful.hosting import call, create_request
+from chalice_restful.routing import RouteTable
+
+
+class Batch:
+    """A handler of requests that consist of many sub-requests.
+
+    The body of a batch request is a list of sub-requests:
+        [
+            {"method": "GET", "path": "/v1/items/1?fields=name"},
+            {"method": "POST", "path": "/v1/items", "body": {...}}
+        ]
+
+    Each sub-request is routed to the endpoint registered by the `Api`
+    in-process, and the response is a list of results in the same order:
+        [
+            {"status": 200, "headers": {...}, "body": {...}},
+            {"status": 201, "headers": {...}, "body": {...}}
+        ]
+
+    Headers of the batch request are inherited by its sub-requests.
+
+    Sub-requests don't go through API Gateway, so they are forbidden
+    to reach endpoints with an `authorizer` or `api_key_required`,
+    unless the batch endpoint itself has the same options.
+    """
+
+    def __init__(self, routes: RouteTable,
+                 request: Callable[[], Request],
+                 local: Any,
+                 max_requests: int,
+                 max_workers: int,
+                 options: Mapping[str, Any]):
+        self.routes = routes
+        self.request = request
+        self.local = local
+        self.max_requests = max_requests
+        self.max_workers = max_workers
+        self.options = options
+        self.executor = None
+
+    def __call__(self) -> List[Dict[str, Any]]:
+        request = self.request()
+        requests = request.json_body
+
+        if not isinstance(requests, list) or \
+           not all(isinstance(x, dict) and 'path' in x for x in requests):
+            raise BadRequestError(
+                'Expected body to be a list of objects with a `path`')
+        if len(requests) > self.max_requests:
+            raise BadRequestError(
+                f'Expected at most {self.max_requests} sub-requests')
+
+        dispatch = lambda x: self.dispatch(x, request)
+
+        if self.max_workers > 1 and len(requests) > 1:
+            # Threads are kept for the life of the container,
+            # so their event loops and connections are reused too.
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.max_workers)
+
+            return list(self.executor.map(dispatch, requests))
+
+        return [dispatch(x) for x in requests]
+
+    def dispatch(self, sub: Dict[str, Any], outer: Request) -> Dict[str, Any]:
+        """Handles the sub-request in the current thread."""
+
+        method = str(sub.get('method', 'GET')).upper()
+        path, _, query = str(sub['path']).partition('?')
+
+        try:
+            route, params = self.routes.resolve(method, path)
+        except ChaliceViewError as e:
+            return _result(error(e))
+
+        for x in ('authorizer', 'api_key_required'):
+            if route.options.get(x) and \
+               route.options.get(x) != self.options.get(x):
+                return _result(error(ForbiddenError(
+                    f'Route {path} can\'t be requested in a batch')))
+
+        # Every sub-request is a request of its own, so it doesn't
+        # inherit the idempotency key and the length of the batch.
+        headers = {k: v for k, v in dict(outer.headers).items()
+                   if k.lower() not in _private_headers}
+        headers.update(sub.get('headers', {}))
+        body = None
+        if 'body' in sub:
+            headers['content-type'] = 'application/json'
+            body = json.dumps(sub['body'])
+
+        sub = create_request(route, params, method, query, headers, body,
+                             outer.context, outer.stage_vars)
+
+        return _result(call(route, params, sub, self.local))
+
+
+_private_headers = {'idempotency-key', 'content-length'}
+
+
+def _result(response: Response) -> Dict[str, Any]:
+    result = {'status': response.status_code,
+              'headers': response.headers,
+              'body': response.body}
+
+    # Bodies serialized by a `json_encoder` are decoded, so they aren't
+    # encoded twice in the batch response.
+    if isinstance(response.body, str) and _is_json(response):
+        try:
+            result['body'] = json.loads(response.body)
+        except ValueError:
+            pass
+
+    if isinstance(response.body, bytes):
+        result['body'] = b64encode(response.body).decode('ascii')
+        result['isBase64Encoded'] = True
+
+    return result
+
+
+def _is_json(response: Response) -> bool:
+    for k, v in response.headers.items():
+        if k.lower() == 'content-type':
+            return v.split(';')[0].strip() == 'application/json'
+
+    return True
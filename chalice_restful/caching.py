@@ -0,0 +1,216 @@
+import json
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Iterable, Tuple
+
+from chalice.app import Request
+
+from chalice_restful.common.guards import ensure
+from chalice_restful.configs import config
+
+
+class CachePolicy:
+    """Lifetime and keys of cached responses, see `cached`."""
+
+    def __init__(self, ttl: float, max_entries: int, vary_on: Tuple[str]):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.vary_on = vary_on
+
+    def key(self, request: Request, params: dict) -> Tuple:
+        """Builds a cache key of the request.
+
+        Args:
+            request: Incoming HTTP-request.
+            params: Path parameters passed to the endpoint.
+        """
+
+        return request_key(request, params, self.vary_on)
+
+
+def request_key(request: Request, params: dict,
+                vary_on: Iterable[str]) -> Tuple:
+    """Builds a key of the request that consists of the specified parts.
+
+    Args:
+        request: Incoming HTTP-request.
+        params: Path parameters passed to the endpoint.
+        vary_on: Parts of a request, see `cached`.
+    """
+
+    parts = []
+
+    for x in vary_on:
+        if x == 'path':
+            parts.append(tuple(sorted(params.items())))
+        elif x == 'query':
+            query = request.query_params or {}
+            parts.append(tuple(sorted(
+                (k, tuple(query.getlist(k))) for k in query)))
+        elif x == 'authorizer':
+            context = request.context or {}
+            parts.append(json.dumps(context.get('authorizer'),
+                                    sort_keys=True, default=str))
+        else:
+            _, _, header = x.partition(':')
+            parts.append(request.headers.get(header))
+
+    return tuple(parts)
+
+
+def ensure_vary_on(vary_on: Iterable[str]):
+    """Ensures that parts of a request are known, see `cached`."""
+
+    for x in vary_on:
+        if x not in ('path', 'query', 'authorizer'):
+            ensure(x).starts_with('headers:')
+
+
+class LruCache:
+    """A bounded in-memory cache with expiring entries.
+
+    When the cache is full, the least recently used entry is evicted.
+    Entries older than `ttl` seconds are never returned.
+
+    The cache is safe to use from many threads (batches, container
+    hosting, etc.).
+    """
+
+    def __init__(self, max_entries: int, ttl: float,
+                 clock: Callable[[], float] = monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns a value of the key if it's present and not expired."""
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+
+            expires, value = entry
+            if expires <= self.clock():
+                del self.entries[key]
+                return default
+
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any, ttl: float = None):
+        """Adds the value, evicting the least recently used one if full.
+
+        Args:
+            key: Key of the value.
+            value: Value to add.
+            ttl: Number of seconds the value is kept for,
+                the `ttl` of the cache by default.
+        """
+
+        ttl = self.ttl if ttl is None else ttl
+
+        with self.lock:
+            self._insert(key, value, self.clock() + ttl)
+
+    def add(self, key: Hashable, value: Any, ttl: float = None) -> bool:
+        """Adds the value only if the key is absent or expired.
+
+        The check and the addition are atomic, so only one of concurrent
+        callers adds the value.
+
+        Returns:
+            Whether the value is added.
+        """
+
+        ttl = self.ttl if ttl is None else ttl
+
+        with self.lock:
+            now = self.clock()
+
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > now:
+                return False
+
+            self._insert(key, value, now + ttl)
+            return True
+
+    def delete(self, key: Hashable):
+        """Removes the key if it's present."""
+
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def _insert(self, key: Hashable, value: Any, expires: float):
+        self.entries[key] = (expires, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+@config
+def cached(ttl: float = 60,
+           max_entries: int = 1024,
+           vary_on: Iterable[str] = ('path', 'query')) -> CachePolicy:
+    """Caches responses of a decorated endpoint or resource in memory.
+
+    Responses are kept in the memory of a container, so they survive
+    between invocations of a warm Lambda and are served without running
+    the endpoint:
+        @route('/v1/items')
+        class Items(Resource):
+            @cached(ttl=30, vary_on=['query', 'headers:Accept'])
+            def get(): ...
+
+    Only `get` endpoints are cached.
+
+    Args:
+        ttl: Number of seconds a response is cached for.
+        max_entries: Maximum number of cached responses per endpoint.
+        vary_on: Parts of a request the cache key consists of:
+            `path` for path parameters, `query` for query parameters,
+            `headers:<Name>` for a value of the specified header
+            and `authorizer` for the principal of a Lambda authorizer.
+    """
+
+    ensure(ttl).is_positive()
+    ensure(max_entries).is_positive()
+
+    ensure_vary_on(vary_on)
+
+    return CachePolicy(ttl, max_entries, tuple(vary_on))
+
+
+def cache(handler: Callable, policy: CachePolicy,
+          request: Callable[[], Request]) -> Callable:
+    """Wraps the handler, so its responses are cached by the policy.
+
+    Args:
+        handler: Endpoint to wrap.
+        policy: Rules of caching.
+        request: Function that returns an incoming HTTP-request.
+    """
+
+    entries = LruCache(policy.max_entries, policy.ttl)
+    missing = object()
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        key = policy.key(request(), kwargs)
+
+        response = entries.get(key, missing)
+        if response is missing:
+            response = handler(*args, **kwargs)
+            entries.put(key, response)
+
+        return response
+
+    return body
@@ -0,0 +1,117 @@
+from functools import wraps
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+from chalice.app import Request, Response
+
+from chalice_restful.caching import ensure_vary_on, request_key
+from chalice_restful.configs import config
+
+
+class Coalescing:
+    """Parts of requests that make them identical, see `coalesce`."""
+
+    def __init__(self, vary_on: Tuple[str]):
+        self.vary_on = vary_on
+
+    def key(self, request: Request, params: dict) -> Tuple:
+        """Builds a key requests are coalesced by."""
+
+        return request_key(request, params, self.vary_on)
+
+
+@config
+def coalesce(vary_on: Iterable[str] = ('path', 'query',
+                                       'headers:Authorization',
+                                       'headers:x-api-key',
+                                       'authorizer')) -> Coalescing:
+    """Makes identical concurrent requests share a single call of an endpoint.
+
+    While a request is being handled, identical requests wait for it
+    and receive the same response instead of calling the endpoint again:
+        @route('/v1/dashboard')
+        class Dashboard(Resource):
+            @coalesce()
+            def get(): ...
+
+    Requests are identical when all the parts listed in `vary_on`
+    are, which are the same as of `cached`. By default, these include
+    the credentials of a client (the `Authorization` and `x-api-key`
+    headers, and the principal of a Lambda authorizer), so clients
+    never receive responses of each other. Drop them only if responses
+    don't depend on the client.
+
+    This only matters when requests are handled concurrently
+    by the same process, e.g. with `Api.wsgi`, `Api.asgi` or batches.
+
+    Endpoints other than `get` aren't coalesced.
+
+    Args:
+        vary_on: Parts of a request the key consists of.
+    """
+
+    ensure_vary_on(vary_on)
+
+    return Coalescing(tuple(vary_on))
+
+
+class _Flight:
+    """A call of an endpoint other requests are waiting for."""
+
+    def __init__(self):
+        self.done = Event()
+        self.response = None
+        self.error = None
+
+
+def single_flight(handler: Callable, coalescing: Coalescing,
+                  request: Callable[[], Request]) -> Callable:
+    """Wraps the handler, so identical concurrent calls are coalesced.
+
+    Args:
+        handler: Endpoint to wrap.
+        coalescing: Rules of building a key of a request.
+        request: Function that returns an incoming HTTP-request.
+    """
+
+    flights: Dict[Hashable, _Flight] = {}
+    lock = Lock()
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        key = coalescing.key(request(), kwargs)
+
+        with lock:
+            flight = flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy(flight.response)
+
+        try:
+            flight.response = handler(*args, **kwargs)
+            return flight.response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with lock:
+                del flights[key]
+            flight.done.set()
+
+    return body
+
+
+def _copy(response: Any) -> Any:
+    # Outer wrappers may change headers of a response,
+    # so every waiting request gets its own copy.
+    if isinstance(response, Response):
+        return Response(body=response.body, headers=dict(response.headers),
+                        status_code=response.status_code)
+
+    return response
@@ -0,0 +1,8 @@
+from chalice.app import ChaliceViewError, Response
+
+
+def error(e: ChaliceViewError) -> Response:
+    """Converts the error into a response the same way Chalice does it."""
+
+    return Response(body={'Code': type(e).__name__, 'Message': str(e)},
+                    status_code=e.STATUS_CODE)
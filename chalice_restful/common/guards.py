@@ -1,5 +1,6 @@
+import json
 from inspect import isclass
-from typing import Any, Iterable, Type
+from typing import Any, Iterable, List, Type
 
 
 class Ensure:
@@ -16,54 +17,128 @@ class Ensure:
         ensure(2 + 2).is_(5)
 
     If the target object satisfies the requirement, nothing happens,
-    otherwise an `AssertionError` is thrown.
+    otherwise an `AssertionError` is thrown. When `failures` are passed,
+    messages are appended to them instead, see `Validation`.
+
+    Messages are formatted only when a requirement isn't satisfied.
     """
 
-    def __init__(self, target: Any):
+    def __init__(self, target: Any, failures: List[str] = None):
         self.target = target
+        self.failures = failures
 
     def is_class(self):
         """Ensures that the target is a class."""
 
-        assert isclass(self.target), \
-            f'Expected {self.target} ' + \
-            f'to be a class'
+        if not isclass(self.target):
+            self._fail('Expected {} to be a class', self.target)
+
+    def is_(self, x: Any):
+        """Ensures that the target is equal to the specified value."""
+
+        if self.target != x:
+            self._fail('Expected {} to be {}', self.target, x)
 
     def is_not(self, x: Any):
         """Ensures that the target is not equal to the specified value."""
 
-        assert self.target != x, \
-            f'Expected {self.target} ' + \
-            f'to not be {x}'
+        if self.target == x:
+            self._fail('Expected {} to not be {}', self.target, x)
+
+    def is_in(self, x: Iterable[Any]):
+        """Ensures that the target is one of the specified values."""
+
+        if self.target not in x:
+            self._fail('Expected {} to be one of {}', self.target, x)
+
+    def is_positive(self):
+        """Ensures that the target is a number greater than zero."""
+
+        if not self.target > 0:
+            self._fail('Expected {} to be positive', self.target)
 
     def is_subclass_of(self, x: Type):
         """Ensures that the target is subclass of the specified."""
 
-        assert issubclass(self.target, x), \
-            f'Expected {self.target} ' + \
-            f'to be a subclass of {x}'
+        if not issubclass(self.target, x):
+            self._fail('Expected {} to be a subclass of {}', self.target, x)
 
     def has_attribute(self, attribute: str):
         """Ensures that the target has attribute of the specified name."""
 
-        assert hasattr(self.target, attribute), \
-            f'Expected {self.target} ' + \
-            f'to have a {attribute} attribute'
+        if not hasattr(self.target, attribute):
+            self._fail('Expected {} to have a {} attribute',
+                       self.target, attribute)
 
     def has_any_attribute(self, of: Iterable[str]):
         """Ensures that the target has any of the specified attributes."""
 
-        matched = (getattr(self.target, x, None) for x in of)
+        for x in of:
+            if getattr(self.target, x, None):
+                return
 
-        assert any(matched), \
-            f'Expected {self.target} to define at least one ' + \
-            f'of the {of} attributes'
+        self._fail('Expected {} to define at least one of the {} attributes',
+                   self.target, of)
 
     def starts_with(self, prefix: str):
         """Ensures that the target string starts with the specified prefix."""
 
-        assert self.target.startswith(prefix), \
-            f'Expected {self.target} to start with {prefix}'
+        if not self.target.startswith(prefix):
+            self._fail('Expected {} to start with {}', self.target, prefix)
+
+    def is_identifier(self):
+        """Ensures that the target string is a valid Python identifier."""
+
+        if not self.target.isidentifier():
+            self._fail('Expected {} to be an identifier', self.target)
+
+    def is_json_serializable(self):
+        """Ensures that the target can be serialized to JSON."""
+
+        try:
+            json.dumps(self.target)
+        except TypeError:
+            self._fail('Expected {} to be JSON serializable', self.target)
+
+    def contains(self, x: Any):
+        """Ensures that the target contains the specified value."""
+
+        if x not in self.target:
+            self._fail('Expected {} to contain {}', self.target, x)
+
+    def _fail(self, message: str, *args: Any):
+        message = message.format(*args)
+
+        if self.failures is None:
+            raise AssertionError(message)
+
+        self.failures.append(message)
+
+
+class Validation:
+    """A batch of requirements that are checked together.
+
+    Unlike `ensure`, requirements don't stop at the first failure,
+    so all of them can be reported at once:
+        validation = Validation()
+        validation.ensure(resource).has_attribute('route')
+        validation.ensure(resource).has_any_attribute(of=['get', 'post'])
+        validation.check()
+    """
+
+    def __init__(self):
+        self.failures: List[str] = []
+
+    def ensure(self, target: Any) -> Ensure:
+        """Starts a requirement, whose failure is collected."""
+
+        return Ensure(target, self.failures)
+
+    def check(self):
+        """Raises an `AssertionError` with all failures, if any."""
+
+        if self.failures:
+            raise AssertionError('; '.join(self.failures))
 
 
 ensure = Ensure
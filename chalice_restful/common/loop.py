@@ -0,0 +1,46 @@
+from functools import wraps
+from threading import local
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from asyncio import AbstractEventLoop
+
+_local = local()
+
+
+def event_loop() -> 'AbstractEventLoop':
+    """Returns an event loop shared by all invocations of a container.
+
+    The loop is created on the first call and is kept alive for
+    the life of the container, so its setup cost and anything
+    bound to it (connection pools, sessions, etc.) are reused.
+
+    Each thread has its own loop, since a loop can't be run
+    by several threads at once.
+
+    `asyncio` is imported on the first call, so APIs without
+    coroutine endpoints don't pay for it on cold starts.
+    """
+
+    loop = getattr(_local, 'loop', None)
+
+    if loop is None or loop.is_closed():
+        from asyncio import new_event_loop
+
+        loop = _local.loop = new_event_loop()
+
+    return loop
+
+
+def synchronous(handler: Callable) -> Callable:
+    """Wraps the coroutine function, so it's run on the shared event loop.
+
+    Chalice can only call plain functions, so the wrapper blocks until
+    the coroutine is complete and returns its result.
+    """
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        return event_loop().run_until_complete(handler(*args, **kwargs))
+
+    return body
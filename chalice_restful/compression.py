@@ -0,0 +1,169 @@
+import gzip
+import zlib
+from functools import wraps
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from chalice.app import Request, Response
+
+from chalice_restful.common.guards import ensure
+from chalice_restful.configs import config
+from chalice_restful.serialization import JsonEncoder, encode_chalice_json
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+compressors = {
+    'gzip': gzip.compress,
+    'deflate': zlib.compress,
+}
+"""Functions that compress bytes, by the name of the algorithm."""
+
+if brotli is not None:
+    compressors['br'] = brotli.compress
+
+
+class Compression:
+    """Algorithms and the size threshold of `compress`."""
+
+    def __init__(self, min_bytes: int, algorithms: Tuple[str]):
+        self.min_bytes = min_bytes
+        self.algorithms = algorithms
+
+    def choose(self, accept_encoding: str) -> Optional[str]:
+        """Returns the most preferred algorithm accepted by a client.
+
+        Algorithms that aren't installed (e.g. `br` without the `brotli`
+        package) and ones explicitly rejected with `q=0` are skipped.
+        """
+
+        accepted = _accepted(accept_encoding)
+
+        for x in self.algorithms:
+            if x in compressors and (x in accepted or '*' in accepted):
+                return x
+
+        return None
+
+
+@config
+def compress(min_bytes: int = 1024,
+             algorithms: Iterable[str] = ('br', 'gzip')) -> Compression:
+    """Compresses large responses of a decorated endpoint or resource.
+
+    The algorithm is chosen by the `Accept-Encoding` header of a request,
+    in the order of preference of `algorithms`:
+        @route('/v1/items')
+        @compress(min_bytes=1024, algorithms=['br', 'gzip'])
+        class Items(Resource):
+            def get(): ...
+
+    Compressed responses are binary, so API Gateway passes them
+    only if their content type is one of the binary types
+    of the application:
+        app.api.binary_types.append('application/json')
+
+    Responses of other content types are never compressed.
+
+    Args:
+        min_bytes: Minimum size of a response to compress.
+        algorithms: Names of the algorithms: `br` (requires the `brotli`
+            package), `gzip` or `deflate`.
+    """
+
+    ensure(min_bytes).is_positive()
+
+    for x in algorithms:
+        ensure(x).is_in(['br', 'gzip', 'deflate'])
+
+    return Compression(min_bytes, tuple(algorithms))
+
+
+def compress_response(handler: Callable, compression: Compression,
+                      request: Callable[[], Request],
+                      binary_types: List[str],
+                      encoder: JsonEncoder = None) -> Callable:
+    """Wraps the handler, so its large responses are compressed.
+
+    Args:
+        handler: Endpoint to wrap.
+        compression: Rules of compression.
+        request: Function that returns an incoming HTTP-request.
+        binary_types: Binary content types of the application.
+        encoder: Function that serializes a value to a JSON string,
+            the Chalice serialization is used by default.
+    """
+
+    encoder = encoder or encode_chalice_json
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        response = handler(*args, **kwargs)
+
+        headers = request().headers
+        algorithm = compression.choose(headers.get('accept-encoding', ''))
+        if algorithm is None:
+            return response
+
+        if not isinstance(response, Response):
+            response = Response(body=response)
+
+        content_type = _header(response, 'content-type') or 'application/json'
+        if not _is_binary(content_type, binary_types):
+            return response
+
+        content = response.body
+        if not isinstance(content, (str, bytes)):
+            content = encoder(content)
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        if len(content) < compression.min_bytes:
+            return response
+
+        headers = {k: v for k, v in response.headers.items()
+                   if k.lower() != 'content-type'}
+
+        return Response(
+            body=compressors[algorithm](content),
+            headers={**headers,
+                     'Content-Type': content_type,
+                     'Content-Encoding': algorithm,
+                     'Vary': 'Accept-Encoding'},
+            status_code=response.status_code)
+
+    return body
+
+
+def _accepted(accept_encoding: str) -> List[str]:
+    accepted = []
+
+    for x in accept_encoding.lower().split(','):
+        name, _, params = x.partition(';')
+        _, _, quality = params.partition('q=')
+
+        try:
+            quality = float(quality) if quality else 1
+        except ValueError:
+            quality = 1
+
+        if quality > 0:
+            accepted.append(name.strip())
+
+    return accepted
+
+
+def _header(response: Response, name: str) -> Optional[str]:
+    for k, v in response.headers.items():
+        if k.lower() == name:
+            return v
+
+    return None
+
+
+def _is_binary(content_type: str, binary_types: List[str]) -> bool:
+    content_type = content_type.split(';')[0].strip().lower()
+    binary_types = [x.lower() for x in binary_types]
+
+    return content_type in binary_types or '*/*' in binary_types
@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+from chalice.app import Request, Response
+
+
+def conditional(handler: Callable,
+                etag: Optional[Callable],
+                last_modified: Optional[Callable],
+                request: Callable[[], Request]) -> Callable:
+    """Wraps the handler, so it supports conditional requests.
+
+    Before the handler is called, the `etag` and `last_modified`
+    validators are called with the same arguments and compared
+    with the `If-None-Match` and `If-Modified-Since` headers.
+    If the client's copy is still fresh, `304 Not Modified` is returned
+    without calling the handler at all.
+
+    Otherwise, the `ETag` and `Last-Modified` headers are added
+    to the response of the handler. Entity tags of any type are
+    converted to strings, and validators that return `None` (e.g.
+    for a missing resource) add no header.
+
+    Args:
+        handler: Endpoint to wrap.
+        etag: Function that returns an entity tag of the resource
+            (e.g. a version number).
+        last_modified: Function that returns a `datetime` of the last
+            modification of the resource.
+        request: Function that returns an incoming HTTP-request.
+    """
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        headers = {}
+
+        tag = etag(*args, **kwargs) if etag else None
+        if tag is not None:
+            headers['ETag'] = _quote(str(tag))
+
+        modified = last_modified(*args, **kwargs) if last_modified else None
+        if modified is not None:
+            headers['Last-Modified'] = _format(modified)
+
+        if _is_fresh(request().headers, headers):
+            return Response(body='', headers=headers, status_code=304)
+
+        response = handler(*args, **kwargs)
+        if not isinstance(response, Response):
+            response = Response(body=response)
+
+        response.headers = {**headers, **response.headers}
+        return response
+
+    return body
+
+
+def _is_fresh(request: Dict[str, str], response: Dict[str, str]) -> bool:
+    # `email.utils` is expensive to import, so it's imported only
+    # when a conditional request is handled, not on cold starts.
+    from email.utils import parsedate_to_datetime
+
+    if_none_match = request.get('if-none-match')
+    if_modified_since = request.get('if-modified-since')
+
+    # `If-None-Match` takes precedence, as defined in RFC 7232.
+    if if_none_match is not None and 'ETag' in response:
+        tags = [_weak(x.strip()) for x in if_none_match.split(',')]
+        return '*' in tags or _weak(response['ETag']) in tags
+
+    if if_modified_since is not None and 'Last-Modified' in response:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        if since is None:
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        modified = parsedate_to_datetime(response['Last-Modified'])
+        return modified <= since
+
+    return False
+
+
+def _quote(etag: str) -> str:
+    if etag.startswith(('"', 'W/"')):
+        return etag
+
+    return f'"{etag}"'
+
+
+def _weak(etag: str) -> str:
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+def _format(x: datetime) -> str:
+    from email.utils import format_datetime
+
+    if x.tzinfo is None:
+        x = x.replace(tzinfo=timezone.utc)
+
+    return format_datetime(x.astimezone(timezone.utc), usegmt=True)
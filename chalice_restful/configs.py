@@ -1,10 +1,79 @@
+import os
 from inspect import isclass, isfunction
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Tuple
 
+registry: Dict[str, Callable] = {}
+"""All decorators `flag` or `config` was applied on, by name.
 
-def _enforce_constraints(decorator: Callable, instance: Any):
-    enforce_class = getattr(decorator, 'only_classes', False)
-    enforce_function = getattr(decorator, 'only_functions', False)
+The `Api` uses this registry to resolve options of each endpoint,
+so any new configuration decorator is picked up automatically.
+"""
+
+strict = os.environ.get('CHALICE_RESTFUL_STRICT', '1').lower() \
+    not in ('0', 'false', 'no')
+"""Whether targets of decorators and resources are validated at runtime.
+
+Validation can be disabled in production with the `CHALICE_RESTFUL_STRICT=0`
+environment variable once it has passed at build time (e.g. by
+`python -m chalice_restful check`), which saves cold start time.
+"""
+
+
+def options(x: Any) -> Dict[str, Any]:
+    """Returns values of all configs applied on the object, by name.
+
+    Decorators store configs in the `__chalice_restful__` dictionary
+    of the object, so configs of decorated objects are resolved with
+    one lookup. Configs assigned as plain attributes of the same
+    names (e.g. `cors = True`) are respected as well.
+
+    Classes inherit configs of all their base classes (including mixins),
+    where configs of a subclass take precedence. Inherited configs are
+    copied into the dictionary of a class when it's decorated first.
+    """
+
+    found = getattr(x, '__dict__', {}).get('__chalice_restful__')
+    return _collect(x) if found is None else found
+
+
+def _collect(x: Any) -> Dict[str, Any]:
+    found = {}
+
+    # The last class of MRO is always `object`, which has no configs.
+    for owner in x.__mro__[-2::-1] if isinstance(x, type) else (x,):
+        attributes = getattr(owner, '__dict__', {})
+
+        for k in attributes.keys() & registry.keys():
+            found[k] = attributes[k]
+
+        found.update(attributes.get('__chalice_restful__', ()))
+
+    return found
+
+
+def _constraints(decorator: Callable) -> Tuple[bool, bool]:
+    found = options(decorator)
+    return (found.get('only_classes', False),
+            found.get('only_functions', False))
+
+
+def _apply(decorator: Callable, constraints: Tuple[bool, bool],
+           x: Any, value: Any):
+    if strict:
+        _enforce_constraints(constraints, x)
+
+    # Own dictionary is created once, so base classes aren't affected.
+    attributes = vars(x)
+    found = attributes.get('__chalice_restful__')
+    if found is None:
+        found = x.__chalice_restful__ = _collect(x) if attributes else {}
+
+    found[decorator.__name__] = value
+    setattr(x, decorator.__name__, value)
+
+
+def _enforce_constraints(constraints: Tuple[bool, bool], instance: Any):
+    enforce_class, enforce_function = constraints
 
     if enforce_class:
         assert not enforce_function, \
@@ -46,11 +115,11 @@ def flag(decorator: Callable):
         print(Test.enabled)  # Prints `True`.
     """
 
-    def body(x: Any):
-
-        _enforce_constraints(decorator, x)
+    registry[decorator.__name__] = decorator
+    constraints = _constraints(decorator)
 
-        setattr(x, decorator.__name__, True)
+    def body(x: Any):
+        _apply(decorator, constraints, x, True)
         return x
 
     return body
@@ -85,18 +154,31 @@ def config(decorator: Callable):
         @config
         def speed(value):
             assert value >= 0
+
+    Decorators that accept several arguments should return the value
+    of config, which is then added instead of the first argument:
+        @config
+        def limits(lower, upper):
+            return (lower, upper)
+
+        @limits(0, 100)
+        def func(): ...
+
+        print(func.limits)  # Prints `(0, 100)`.
     """
 
-    def decorator_body(value: Any):
+    registry[decorator.__name__] = decorator
+    constraints = _constraints(decorator)
 
-        # This allows client to validate the value in the decorator body.
-        decorator(value)
+    def decorator_body(*args, **kwargs):
 
-        def body(*args, **kwargs):
-            x = args[0]
-            _enforce_constraints(decorator, x)
+        # This allows client to validate the value in the decorator body.
+        value = decorator(*args, **kwargs)
+        if value is None:
+            value = args[0]
 
-            setattr(x, decorator.__name__, value)
+        def body(x: Any):
+            _apply(decorator, constraints, x, value)
             return x
 
         return body
@@ -162,3 +244,21 @@ def only_functions():
         @flag
         def enabled(): ...
     """
+
+
+@flag
+def route_option():
+    """Makes configuration decorator an option of `Chalice.route`.
+
+    This decorator works as a `flag`, so it adds the `route_option`
+    boolean attribute to the decorated object. When an endpoint
+    is added to the `Api`, the values of such configs are passed
+    to `Chalice.route` as keyword arguments of the same name.
+
+    For example:
+        @flag
+        @route_option
+        def cors(): ...
+
+    Like `only_classes`, it should be placed BELOW `flag` or `config`.
+    """
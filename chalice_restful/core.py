@@ -1,10 +1,45 @@
-from typing import Callable, Dict, Type
+from functools import wraps
+from logging import getLogger
+from threading import RLock, local
+from importlib import import_module
+from inspect import iscoroutinefunction
+from types import MappingProxyType, ModuleType
+from weakref import WeakKeyDictionary
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, List,
+                    Mapping, MutableMapping, Optional, Tuple, Type, Union)
 
 from chalice import Chalice
-from chalice.app import Request
-
-from chalice_restful.common.guards import ensure
-from chalice_restful.configs import config, flag, only_classes
+from chalice.app import MethodNotAllowedError, Request, Response
+
+from chalice_restful.authorization import authorize
+from chalice_restful.caching import cache
+from chalice_restful.coalescing import single_flight
+from chalice_restful.common.guards import Validation, ensure
+from chalice_restful.common.loop import synchronous
+from chalice_restful.compression import compress_response
+from chalice_restful.conditional import conditional
+from chalice_restful import configs
+from chalice_restful.configs import config, flag, only_classes, route_option
+from chalice_restful.discovery import (load_manifest, save_manifest, scan,
+                                      target)
+from chalice_restful.endpoints import (Endpoint, LazyEndpoint, parameters,
+                                       resolve)
+from chalice_restful.idempotency import replay
+from chalice_restful.injection import Provider, dependencies, inject
+from chalice_restful.instrumentation import Measurement, instrument
+from chalice_restful.pagination import paginate
+from chalice_restful.rate_limiting import limit
+from chalice_restful.routing import Route, RouteTable
+from chalice_restful.serialization import JsonEncoder, serialize
+from chalice_restful.timeouts import (Deadline, limit_coroutine_time,
+                                      limit_time, remaining)
+from chalice_restful.validation import validate
+from chalice_restful.warming import is_warm_up
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chalice_restful.hosting import Asgi, Wsgi
+
+_log = getLogger(__name__)
 
 
 @config
@@ -21,6 +56,7 @@ def route(path: str):
 
 
 @flag
+@route_option
 def cors():
     """Enables CORS for a decorated endpoint or resource.
 
@@ -33,6 +69,7 @@ def cors():
 
 
 @flag
+@route_option
 def api_key_required():
     """Enforces a decorated endpoint or resource to require API key.
 
@@ -84,8 +121,45 @@ class Resource:
             @cors
             def get(): ...
             def put(): ...
+
+    Handlers can also be defined as coroutine functions with `async def`.
+    They are run on the event loop that is shared by all requests
+    handled by the same container.
+
+    Resources can support conditional GET requests by defining
+    an `etag` or a `last_modified` method next to `get`. They accept
+    the same arguments as `get`, and if the client's copy is still fresh,
+    `304 Not Modified` is returned without calling `get` at all:
+        @route('/v1/items/{id}')
+        class Item(Resource):
+            def etag(id): return table.get_version(id)
+            def get(id): return table.get(id)
+
+    Handlers that accept `self` are bound to an instance of the resource,
+    which is created once per container on the first request, so it can keep
+    expensive objects (connections, clients, etc.) between requests:
+        @route('/v1/items')
+        class Items(Resource):
+            def setup(self):
+                self.table = boto3.resource('dynamodb').Table('items')
+
+            def get(self): ...
     """
 
+    def setup(self):
+        """Prepares the resource instance for handling requests.
+
+        This method is called once, right after the instance is created,
+        and does nothing by default.
+        """
+
+    def warm(self):
+        """Primes connections and caches of the resource.
+
+        This method is called on every warm-up ping (see `Api.warm`),
+        and does nothing by default.
+        """
+
 
 class Api:
     """A RESTful API.
@@ -106,12 +180,60 @@ class Api:
     `Chalice` instance.
 
     The `app.app` should be used in the `template.yaml` file as an API handler.
+
+    Every endpoint can be instrumented with a sink that receives
+    a `Measurement` after each invocation:
+        api = Api(app, instrumentation=EmbeddedMetrics('Example'))
+
+    A sink is any callable, so a `Histogram`, an `EmbeddedMetrics`
+    or a plain function can be used.
+
+    Responses of all endpoints can be serialized by a custom JSON encoder
+    instead of the Chalice one, e.g. `encode_json` that uses `orjson`:
+        api = Api(app, json_encoder=encode_json)
+
+    Resources are validated when they are added. Once they are checked
+    at build time (e.g. by `python -m chalice_restful check`), validation
+    can be skipped in production to save cold start time:
+        api = Api(app, strict=False)
+
+    By default, it's skipped if the `CHALICE_RESTFUL_STRICT=0` environment
+    variable is set, which also skips validation of config decorators.
+
+    Warm-up pings are recognised by `lambda_handler`, which should be used
+    in the `template.yaml` file instead of `app.app` to handle them
+    without going through Chalice routing. Besides scheduled events,
+    requests with a marker header can be pings, as long as the header
+    carries a shared secret:
+        api = Api(app, warm_up_header='X-Warm-Up',
+                  warm_up_secret=os.environ['WARM_UP_SECRET'])
     """
 
     supported_methods = ['get', 'post', 'put', 'patch', 'delete']
 
-    def __init__(self, app: Chalice):
+    def __init__(self, app: Chalice,
+                 instrumentation: Callable[[Measurement], Any] = None,
+                 json_encoder: JsonEncoder = None,
+                 warm_up_header: str = None,
+                 warm_up_secret: str = None,
+                 strict: bool = None):
+        if warm_up_header is not None:
+            ensure(warm_up_secret).is_not(None)
+            ensure(warm_up_secret).is_not('')
+
         self.app = app
+        self.strict = configs.strict if strict is None else strict
+        self.instrumentation = instrumentation
+        self.json_encoder = json_encoder
+        self.warm_up_header = warm_up_header
+        self.warm_up_secret = warm_up_secret
+        self.providers: Dict[str, Provider] = {}
+        self.routes = RouteTable()
+        self.local = local()
+        self.instances = {}
+        self.lock = RLock()
+        self.endpoints: List[Endpoint] = []
+        self.lazy_endpoints: List[LazyEndpoint] = []
 
     @property
     def request(self) -> Request:
@@ -120,9 +242,89 @@ class Api:
         This property is similar to `Chalice.current_request`,
         but is more verbose and small. It's ususally accessed as
         `api.request`.
+
+        While sub-requests of a batch are handled, this property returns
+        the sub-request of the current thread instead.
         """
 
-        return self.app.current_request
+        return getattr(self.local, 'request', None) or \
+            self.app.current_request
+
+    @property
+    def deadline(self) -> Optional[Deadline]:
+        """Deadline of the incoming HTTP-request.
+
+        For endpoints with a `timeout`, it's the timeout or the remaining
+        time of the Lambda invocation, whichever comes first. For others,
+        it's the remaining time of the Lambda invocation, or `None`
+        if the handler isn't invoked by Lambda.
+        """
+
+        deadline = getattr(self.local, 'deadline', None)
+        if deadline is not None:
+            return deadline
+
+        left = remaining(self._lambda_context())
+        return Deadline.after(left) if left is not None else None
+
+    def instance(self, resource: Type) -> Resource:
+        """Returns an instance of the resource.
+
+        The instance is created and set up only once, so all requests
+        handled by the same container share it.
+        """
+
+        instance = self.instances.get(resource)
+        if instance is not None:
+            return instance
+
+        # Concurrent first requests (e.g. in a batch) create one instance.
+        with self.lock:
+            if resource not in self.instances:
+                instance = resource()
+                instance.setup()
+
+                self.instances[resource] = instance
+
+        return self.instances[resource]
+
+    def provide(self, name: str, factory: Callable[[], Any],
+                scope: str = 'container'):
+        """Registers a dependency injected into endpoints by its name.
+
+        Endpoints declare dependencies as parameters, and the `Api`
+        passes them on every call:
+            api.provide('dynamodb', lambda: boto3.client('dynamodb'))
+            api.provide('http', requests.Session)
+
+            @route('/v1/items/{id}')
+            class Item(Resource):
+                def get(id, dynamodb, http): ...
+
+        Dependencies of the `container` scope (e.g. clients and pooled
+        sessions) are created once per container and shared by all
+        requests, so their connections are reused. Ones of the `request`
+        scope are created for every request.
+
+        Path parameters take precedence over dependencies of the same name.
+        Dependencies are injected into the `etag`, `last_modified`
+        and `warm` methods of resources as well. Registering a name
+        again replaces its provider.
+
+        Args:
+            name: Name of the parameter the dependency is passed as.
+            factory: Function that creates the dependency.
+            scope: Either `container` or `request`.
+
+        Raises:
+            AssertionError: Raised if `name` isn't an identifier
+                or `scope` is unknown.
+        """
+
+        ensure(name).is_identifier()
+        ensure(scope).is_in(Provider.scopes)
+
+        self.providers[name] = Provider(factory, scope)
 
     def add(self, resource: Type):
         """Defines a `Resource` in the API.
@@ -141,31 +343,433 @@ class Api:
                 c) `resource` doesn't have endpoints defined.
         """
 
-        def add_method(method: Callable, app: Chalice):
-            def put(field: str, to: Dict[str, str]):
-                if field not in to:
-                    value = getattr(method, field, None) or \
-                            getattr(resource, field, None)
+        if self.strict:
+            self._validate(resource)
 
-                    if value:
-                        to[field] = value
+        self._add_resource(resource)
 
-            methods = [method.__name__.upper()]
-            kwargs = {'methods': methods}
+    def add_all(self, package: Union[ModuleType, str]):
+        """Defines all `Resource` subclasses of the package in the API.
 
-            put('authorizer', to=kwargs)
-            put('cors', to=kwargs)
-            put('api_key_required', to=kwargs)
+        Every module of the package is imported, and each `Resource`
+        subclass with a `route` attribute is added, as if it was
+        passed to `add`:
+            api.add_all('app.resources')
 
-            route = app.route(resource.route, **kwargs)
-            route(method)
+        All the resources are validated before any of them is added,
+        so errors of every invalid resource are reported together.
 
-        ensure(resource).is_subclass_of(Resource)
-        ensure(resource).has_attribute('route')
-        ensure(resource).has_any_attribute(of=self.supported_methods)
+        Args:
+            package: Package or its name.
+
+        Raises:
+            AssertionError: Raised if any of the resources is invalid.
+        """
+
+        resources = scan(package, base=Resource)
+        errors = []
+
+        for x in resources if self.strict else []:
+            try:
+                self._validate(x)
+            except AssertionError as e:
+                errors.append(f'{x.__qualname__}: {e}')
+
+        assert not errors, \
+            f'Found {len(errors)} invalid resources:\n' + \
+            '\n'.join(errors)
+
+        for x in resources:
+            self._add_resource(x)
+
+    def save_manifest(self, file: str):
+        """Saves the route table of the added resources to the file.
+
+        The manifest can be loaded with `add_manifest`, which
+        adds resources lazily, so production cold starts don't
+        import every module to find them:
+            api.add_all('app.resources')
+            api.save_manifest('manifest.json')  # At build time.
+
+            api.add_manifest('manifest.json')   # At runtime.
+
+        Resources added lazily are saved as well, without importing them.
+
+        Raises:
+            AssertionError: Raised if options of an endpoint
+                aren't JSON serializable (e.g. an `authorizer`).
+        """
+
+        entries = [{'path': x.path,
+                    'target': x.target if isinstance(x, LazyEndpoint)
+                    else target(x.resource),
+                    'method': x.method.lower(),
+                    'options': dict(x.route_options)}
+                   for x in self.endpoints + self.lazy_endpoints]
+
+        save_manifest(entries, file)
+
+    def add_manifest(self, file: str):
+        """Defines all resources of the manifest in the API lazily.
+
+        See `save_manifest` and `add_lazy` for details.
+        """
+
+        for x in load_manifest(file):
+            self.add_lazy(x['path'], x['target'],
+                          methods=[x['method']], **x['options'])
+
+    def add_lazy(self, path: str, target: str,
+                 methods: Iterable[str] = None, **options):
+        """Defines a `Resource` in the API without importing it.
 
-        methods = (getattr(resource, x, None) for x in Api.supported_methods)
-        methods = [x for x in methods if x]
+        Unlike `add`, this method registers lightweight stub endpoints
+        in the `Chalice` instance, and the module of the resource is
+        imported only when the first request hits one of them:
+            api.add_lazy('/v1/items', 'app.resources.items:Items')
+
+        This keeps cold starts cheap for large APIs, because each
+        invocation pays only for the resources it actually touches.
+
+        Since the resource isn't imported, its configs (`cors`,
+        `authorizer`, etc.) can't be seen at registration time, so
+        they should be passed explicitly:
+            api.add_lazy('/v1/items', 'app.resources.items:Items',
+                         methods=['get', 'post'], cors=True)
+
+        The stub endpoints are recorded in `lazy_endpoints`, so they
+        are exported and checked along with the added ones.
+
+        Args:
+            path: Route of the resource, should match its `route` attribute.
+            target: Location of the resource in the `module:Class` format.
+            methods: HTTP-methods to register, all supported by default.
+            options: Additional options passed to `Chalice.route`.
+
+        Raises:
+            AssertionError: Raised if:
+                a) `path` doesn't start with `/`;
+                b) `target` isn't in the `module:Class` format;
+                c) `methods` contain an unsupported HTTP-method.
+        """
+
+        methods = methods or self.supported_methods
+
+        if self.strict:
+            ensure(path).starts_with('/')
+            ensure(target).contains(':')
+
+            for x in methods:
+                ensure(x).is_in(self.supported_methods)
+
+        lazy = _LazyResource(self, path, target, options)
 
         for x in methods:
-            add_method(x, self.app)
+            self._register(path, x.upper(), lazy.endpoint(x), options)
+
+            self.lazy_endpoints.append(LazyEndpoint(
+                target, path, x.upper(), MappingProxyType(options)))
+
+    def add_batch(self, path: str = '/batch', max_requests: int = 25,
+                  max_workers: int = 1, **options):
+        """Defines an endpoint that handles many requests at once.
+
+        The endpoint accepts `POST` requests with a list of sub-requests,
+        routes each of them to the endpoints added to the API in-process,
+        and returns all the results in a single response:
+            api.add_batch('/batch', max_workers=4)
+
+        This saves API Gateway and Lambda overhead of every sub-request.
+        See `Batch` for the format of requests and responses.
+
+        Args:
+            path: Route of the batch endpoint.
+            max_requests: Maximum number of sub-requests in a batch.
+            max_workers: Number of threads sub-requests are handled by,
+                they are handled sequentially by default.
+            options: Additional options passed to `Chalice.route`.
+        """
+
+        ensure(path).starts_with('/')
+        ensure(max_requests).is_positive()
+        ensure(max_workers).is_positive()
+
+        # Batching, as well as hosting, is imported only when it's used,
+        # so APIs without it don't pay for the import on cold starts.
+        from chalice_restful.batching import Batch
+
+        batch = Batch(self.routes, lambda: self.request, self.local,
+                      max_requests, max_workers, options)
+
+        def post(): return batch()
+
+        route = self.app.route(path, methods=['POST'], **options)
+        route(post)
+
+    def lambda_handler(self, event: Dict[str, Any], context: Any) -> Any:
+        """Handles an invocation of the Lambda.
+
+        Warm-up pings (scheduled CloudWatch events, or requests with
+        the `warm_up_header` set to the `warm_up_secret`) are answered
+        right away with `204 No Content`
+        after the resources are warmed, see `warm`. Other events are
+        passed to the `Chalice` application.
+
+        This method should be used as the Lambda handler:
+            Handler: app.api.lambda_handler
+        """
+
+        if is_warm_up(event, self.warm_up_header, self.warm_up_secret):
+            self.warm()
+            return Response(body='', status_code=204).to_dict()
+
+        return self.app(event, context)
+
+    def warm(self):
+        """Calls the `warm` method of every added resource.
+
+        Resources that define `warm` with `self` are instantiated (and set up)
+        if they aren't yet. Resources added lazily aren't imported.
+
+        Errors are logged and don't stop other resources from warming.
+        """
+
+        resources = dict.fromkeys(x.resource for x in self.endpoints)
+
+        for x in resources:
+            warm = self._method(x, 'warm')
+
+            try:
+                warm()
+            except Exception:
+                _log.error('Failed to warm %s', x.__qualname__, exc_info=True)
+
+    def wsgi(self) -> 'Wsgi':
+        """Creates a WSGI application that serves the API.
+
+        Requests are routed by the radix tree of the added routes directly
+        to the handlers, bypassing Chalice, so the same resources can be
+        served by a WSGI server in a container:
+            application = api.wsgi()  # gunicorn app:application
+        """
+
+        from chalice_restful.hosting import Wsgi
+
+        return Wsgi(self.routes, self.local, self.json_encoder)
+
+    def asgi(self) -> 'Asgi':
+        """Creates an ASGI application that serves the API.
+
+        Works like `wsgi`, but for ASGI servers:
+            application = api.asgi()  # uvicorn app:application
+        """
+
+        from chalice_restful.hosting import Asgi
+
+        return Asgi(self.routes, self.local, self.json_encoder)
+
+    def _validate(self, resource: Type):
+        # Results are cached per class, so resources added to many APIs
+        # (or again) aren't validated twice.
+        results = _validated.setdefault(resource, {})
+        methods = tuple(self.supported_methods)
+
+        if methods not in results:
+            validation = Validation()
+            validation.ensure(resource).is_subclass_of(Resource)
+            validation.ensure(resource).has_attribute('route')
+            validation.ensure(resource).has_any_attribute(of=methods)
+
+            results[methods] = validation
+
+        results[methods].check()
+
+    def _add_resource(self, resource: Type):
+        for x in resolve(resource, self.supported_methods):
+            self._add_endpoint(x)
+
+    def _add_endpoint(self, endpoint: Endpoint):
+        self._register(endpoint.path, endpoint.method,
+                       self._handler(endpoint), endpoint.route_options)
+
+        self.endpoints.append(endpoint)
+
+    def _register(self, path: str, method: str, handler: Callable,
+                  options: Mapping[str, Any]):
+        route = self.app.route(path, methods=[method], **options)
+        route(handler)
+
+        self.routes.add(Route(path, method, handler, options))
+
+    def _handler(self, endpoint: Endpoint) -> Callable:
+        handler = endpoint.function
+
+        if _accepts_self(endpoint.parameters):
+            handler = self._bind(endpoint.resource, endpoint.function)
+
+        timeout = endpoint.options.get('timeout')
+        coroutine = iscoroutinefunction(endpoint.function)
+
+        if coroutine:
+            if timeout:
+                handler = limit_coroutine_time(handler, timeout,
+                                               self._lambda_context,
+                                               self.local)
+            handler = synchronous(handler)
+
+        names = dependencies(endpoint.parameters)
+        if names:
+            handler = inject(handler, names, self.providers)
+
+        paginated = endpoint.options.get('paginated')
+        if paginated and endpoint.method == 'GET':
+            handler = paginate(handler, paginated, lambda: self.request,
+                               self.json_encoder)
+
+        body = endpoint.options.get('body')
+        if body and endpoint.method in ('POST', 'PUT', 'PATCH'):
+            handler = validate(handler, body, lambda: self.request)
+
+        if self.json_encoder:
+            handler = serialize(handler, self.json_encoder)
+
+        cached = endpoint.options.get('cached')
+        if cached and endpoint.method == 'GET':
+            handler = cache(handler, cached, lambda: self.request)
+
+        coalescing = endpoint.options.get('coalesce')
+        if coalescing and endpoint.method == 'GET':
+            handler = single_flight(handler, coalescing, lambda: self.request)
+
+        compress = endpoint.options.get('compress')
+        if compress:
+            handler = compress_response(handler, compress,
+                                        lambda: self.request,
+                                        self.app.api.binary_types,
+                                        self.json_encoder)
+
+        if endpoint.method == 'GET':
+            etag = self._method(endpoint.resource, 'etag')
+            last_modified = self._method(endpoint.resource, 'last_modified')
+
+            if etag or last_modified:
+                handler = conditional(handler, etag, last_modified,
+                                      lambda: self.request)
+
+        idempotent = endpoint.options.get('idempotent')
+        if idempotent and endpoint.method in idempotent.methods:
+            handler = replay(handler, idempotent, lambda: self.request,
+                             self.json_encoder)
+
+        if timeout and not coroutine:
+            handler = limit_time(handler, timeout, self._lambda_context,
+                                 self.local, lambda: self.request)
+
+        token_authorizer = endpoint.options.get('token_authorizer')
+        if token_authorizer:
+            handler = authorize(handler, token_authorizer,
+                                lambda: self.request)
+
+        rate_limit = endpoint.options.get('rate_limit')
+        if rate_limit:
+            handler = limit(handler, rate_limit, lambda: self.request)
+
+        if self.instrumentation:
+            handler = instrument(handler, endpoint, self.instrumentation)
+
+        return handler
+
+    def _lambda_context(self) -> Any:
+        return getattr(self.app, 'lambda_context', None)
+
+    def _method(self, resource: Type, name: str) -> Optional[Callable]:
+        method = getattr(resource, name, None)
+        if not method:
+            return None
+
+        names = parameters(method)
+
+        if _accepts_self(names):
+            method = self._bind(resource, method)
+
+        names = dependencies(names)
+        if names:
+            method = inject(method, names, self.providers)
+
+        return method
+
+    def _bind(self, resource: Type, method: Callable) -> Callable:
+        @wraps(method)
+        def body(*args, **kwargs):
+            return method(self.instance(resource), *args, **kwargs)
+
+        return body
+
+
+_validated: MutableMapping[Type, Dict[Tuple[str], Validation]] = \
+    WeakKeyDictionary()
+"""Validations of resources by the supported HTTP-methods of an `Api`."""
+
+
+def _accepts_self(parameters: Tuple[str, ...]) -> bool:
+    return parameters[:1] == ('self',)
+
+
+class _LazyResource:
+    """A `Resource` that is imported on the first request.
+
+    Instances of this class are created by `Api.add_lazy` and produce
+    stub endpoints, which resolve the real resource and delegate
+    to its handlers.
+
+    In strict mode, route options of the real endpoints (e.g. their
+    `authorizer`) should match the `options` the stubs are registered
+    with, so a protected resource isn't served without its protection.
+    """
+
+    def __init__(self, api: Api, path: str, target: str,
+                 options: Mapping[str, Any]):
+        self.api = api
+        self.path = path
+        self.target = target
+        self.options = options
+        self.resource = None
+
+    def resolve(self) -> Type:
+        """Imports the resource if it isn't imported yet."""
+
+        if self.resource is None:
+            module, _, name = self.target.partition(':')
+            resource = getattr(import_module(module), name)
+
+            if self.api.strict:
+                ensure(resource).is_subclass_of(Resource)
+                ensure(resource).has_attribute('route')
+                ensure(resource.route).is_(self.path)
+
+            self.resource = resource
+
+        return self.resource
+
+    def endpoint(self, name: str) -> Callable:
+        """Creates a stub endpoint for the specified HTTP-method."""
+
+        handlers = []
+
+        def stub(*args, **kwargs):
+            if not handlers:
+                endpoints = resolve(self.resolve(), [name])
+                if not endpoints:
+                    raise MethodNotAllowedError(
+                        f'Unsupported method: {name.upper()}')
+
+                if self.api.strict:
+                    ensure(dict(endpoints[0].route_options)) \
+                        .is_(dict(self.options))
+
+                handlers.append(self.api._handler(endpoints[0]))
+
+            return handlers[0](*args, **kwargs)
+
+        stub.__name__ = name
+        return stub
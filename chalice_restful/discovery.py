@@ -0,0 +1,67 @@
+import json
+from importlib import import_module
+from inspect import getmembers, isclass
+from pkgutil import walk_packages
+from types import ModuleType
+from typing import Any, Dict, List, Type, Union
+
+from chalice_restful.common.guards import ensure
+
+
+def scan(package: Union[ModuleType, str], base: Type) -> List[Type]:
+    """Finds all subclasses of the base that have a `route` in the package.
+
+    Every module of the package (including nested packages) is imported,
+    and only classes defined in the module itself are collected,
+    so re-imported classes aren't found twice.
+
+    Args:
+        package: Package or its name.
+        base: Class the resources should be subclasses of.
+    """
+
+    if isinstance(package, str):
+        package = import_module(package)
+
+    modules = [package]
+    if hasattr(package, '__path__'):
+        prefix = package.__name__ + '.'
+        modules += [import_module(x.name)
+                    for x in walk_packages(package.__path__, prefix)]
+
+    resources = []
+
+    for module in modules:
+        for _, x in getmembers(module, isclass):
+            if x is not base and \
+               issubclass(x, base) and \
+               x.__module__ == module.__name__ and \
+               hasattr(x, 'route'):
+                resources.append(x)
+
+    return resources
+
+
+def target(resource: Type) -> str:
+    """Returns location of the resource in the `module:Class` format."""
+
+    ensure(resource.__qualname__).is_(resource.__name__)
+
+    return f'{resource.__module__}:{resource.__name__}'
+
+
+def save_manifest(entries: List[Dict[str, Any]], file: str):
+    """Saves the route table to the JSON manifest file."""
+
+    for x in entries:
+        ensure(x['options']).is_json_serializable()
+
+    with open(file, 'w') as f:
+        json.dump(entries, f, indent=2)
+
+
+def load_manifest(file: str) -> List[Dict[str, Any]]:
+    """Loads the route table from the JSON manifest file."""
+
+    with open(file) as f:
+        return json.load(f)
@@ -0,0 +1,105 @@
+from inspect import signature
+from types import MappingProxyType
+from typing import (Any, Callable, Dict, Iterable, List, Mapping, NamedTuple,
+                    Tuple, Type)
+
+from chalice_restful.configs import options as configs, registry
+
+
+class Endpoint(NamedTuple):
+    """A resolved endpoint of a resource.
+
+    Represents a handler of one HTTP-method together with all the configs
+    applied on it, where configs of the handler take precedence over
+    configs of its resource.
+
+    Endpoints are resolved once, when a resource is added to the `Api`,
+    and can be inspected afterwards:
+        for x in api.endpoints:
+            print(x.method, x.path, x.options)
+    """
+
+    resource: Type
+    function: Callable
+    path: str
+    method: str
+    options: Mapping[str, Any]
+    route_options: Mapping[str, Any]
+    parameters: Tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        """Name of the handler, e.g. `get`."""
+
+        return self.function.__name__
+
+
+class LazyEndpoint(NamedTuple):
+    """An endpoint of a resource added lazily.
+
+    Unlike `Endpoint`, its resource isn't imported, so only its location
+    in the `module:Class` format and the options passed to `Api.add_lazy`
+    are known. Lazy endpoints can be inspected afterwards:
+        for x in api.lazy_endpoints:
+            print(x.method, x.path, x.target)
+    """
+
+    target: str
+    path: str
+    method: str
+    route_options: Mapping[str, Any]
+
+    @property
+    def name(self) -> str:
+        """Name of the handler, e.g. `get`."""
+
+        return self.method.lower()
+
+
+def resolve(resource: Type, methods: Iterable[str]) -> List[Endpoint]:
+    """Resolves endpoints of the resource.
+
+    Args:
+        resource: Type that represents a group of endpoints.
+        methods: Names of the handlers to resolve, missing ones are skipped.
+    """
+
+    defaults = _options(resource)
+    endpoints = []
+
+    for x in methods:
+        function = getattr(resource, x, None)
+        if not function:
+            continue
+
+        options = {**defaults, **_options(function)}
+        route_options = {k: v for k, v in options.items()
+                         if configs(registry[k]).get('route_option')}
+
+        endpoints.append(Endpoint(
+            resource=resource,
+            function=function,
+            path=resource.route,
+            method=x.upper(),
+            options=MappingProxyType(options),
+            route_options=MappingProxyType(route_options),
+            parameters=parameters(function)))
+
+    return endpoints
+
+
+def parameters(function: Callable) -> Tuple[str, ...]:
+    """Returns names of the named parameters of the function, in order."""
+
+    # Code of plain functions is read directly, since `signature`
+    # is slow; wrapped functions and other callables rely on it.
+    code = getattr(function, '__code__', None)
+    if code is None or hasattr(function, '__wrapped__'):
+        return tuple(x.name for x in signature(function).parameters.values()
+                     if x.kind not in (x.VAR_POSITIONAL, x.VAR_KEYWORD))
+
+    return code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+
+
+def _options(x: Any) -> Dict[str, Any]:
+    return {k: v for k, v in configs(x).items() if v}
@@ -0,0 +1,210 @@
+from http import HTTPStatus
+from logging import getLogger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from chalice.app import ChaliceViewError, Request, Response
+
+from chalice_restful.common.errors import error
+from chalice_restful.routing import Route, RouteTable
+from chalice_restful.serialization import JsonEncoder, encode_chalice_json
+
+_log = getLogger(__name__)
+
+
+def call(route: Route, params: Dict[str, str], request: Request,
+         local: Any) -> Response:
+    """Calls the handler of the route with the request in the current thread.
+
+    While the handler runs, the request is stored in `local.request`,
+    so it's available as `api.request`.
+
+    Errors are converted into responses the same way Chalice does it.
+    """
+
+    local.request = request
+
+    try:
+        response = route.handler(**params)
+        if not isinstance(response, Response):
+            response = Response(body=response)
+        return response
+    except ChaliceViewError as e:
+        return error(e)
+    except Exception:
+        _log.error('Caught exception for %s %s', route.method, route.path,
+                   exc_info=True)
+        return Response(body={'Code': 'InternalServerError',
+                              'Message': 'An internal server error occurred.'},
+                        status_code=500)
+    finally:
+        local.request = None
+
+
+def create_request(route: Route, params: Dict[str, str], method: str,
+                   query: str, headers: Dict[str, str], body: Optional[bytes],
+                   context: Dict[str, Any] = None,
+                   stage_vars: Dict[str, str] = None) -> Request:
+    """Creates a Chalice request for the route from raw HTTP values."""
+
+    return Request(
+        query_params=parse_qs(query) or None,
+        headers=headers,
+        uri_params=params or None,
+        method=method,
+        body=body,
+        context={**(context or {}),
+                 'resourcePath': route.path,
+                 'httpMethod': method},
+        stage_vars=stage_vars,
+        is_base64_encoded=False)
+
+
+class Wsgi:
+    """A WSGI application that serves the routes of the `Api`.
+
+    Requests are routed by the radix tree of the `RouteTable` directly
+    to the handlers, bypassing Chalice routing, so the same resources
+    can be served by any WSGI server (e.g. gunicorn) in a container:
+        application = api.wsgi()
+
+    Features of API Gateway (authorizers, API keys, CORS preflights
+    and content type checks) aren't emulated.
+    """
+
+    def __init__(self, routes: RouteTable, local: Any,
+                 encoder: JsonEncoder = None):
+        self.routes = routes
+        self.local = local
+        self.encoder = encoder or encode_chalice_json
+
+    def __call__(self, environ: Dict[str, Any],
+                 start_response: Callable) -> List[bytes]:
+        headers = {k[5:].replace('_', '-').lower(): v
+                   for k, v in environ.items() if k.startswith('HTTP_')}
+        if environ.get('CONTENT_TYPE'):
+            headers['content-type'] = environ['CONTENT_TYPE']
+
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        body = environ['wsgi.input'].read(length) if length else None
+
+        response = handle(self.routes, self.local,
+                          environ['REQUEST_METHOD'],
+                          environ.get('PATH_INFO') or '/',
+                          environ.get('QUERY_STRING', ''),
+                          headers, body, environ.get('REMOTE_ADDR'))
+
+        status, headers, body = encode(response, self.encoder)
+        start_response(f'{status} {HTTPStatus(status).phrase}',
+                       [(k.decode('latin-1'), v.decode('latin-1'))
+                        for k, v in headers])
+
+        return [body]
+
+
+class Asgi:
+    """An ASGI application that serves the routes of the `Api`.
+
+    Works like `Wsgi`, but for ASGI servers (e.g. uvicorn):
+        application = api.asgi()
+
+    Handlers are synchronous, so each request is handled
+    in a thread of the default executor of the server's loop.
+    """
+
+    def __init__(self, routes: RouteTable, local: Any,
+                 encoder: JsonEncoder = None):
+        self.routes = routes
+        self.local = local
+        self.encoder = encoder or encode_chalice_json
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable,
+                       send: Callable):
+        if scope['type'] == 'lifespan':
+            return await _lifespan(receive, send)
+
+        assert scope['type'] == 'http', \
+            f'Expected {scope["type"]} to be `http`'
+
+        headers = {k.decode('latin-1').lower(): v.decode('latin-1')
+                   for k, v in scope.get('headers', [])}
+
+        body = b''
+        more = True
+        while more:
+            message = await receive()
+            body += message.get('body', b'')
+            more = message.get('more_body', False)
+
+        from asyncio import get_running_loop
+
+        loop = get_running_loop()
+        response = await loop.run_in_executor(
+            None, handle, self.routes, self.local,
+            scope['method'], scope['path'],
+            scope.get('query_string', b'').decode('latin-1'),
+            headers, body or None, (scope.get('client') or [None])[0])
+
+        status, headers, body = encode(response, self.encoder)
+        await send({'type': 'http.response.start',
+                    'status': status,
+                    'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+
+def handle(routes: RouteTable, local: Any, method: str, path: str,
+           query: str, headers: Dict[str, str], body: Optional[bytes],
+           source_ip: str = None) -> Response:
+    """Routes and handles a raw HTTP request.
+
+    The address of the client is passed to handlers as the `sourceIp`
+    of the request context, like API Gateway does it.
+    """
+
+    try:
+        route, params = routes.resolve(method, path)
+    except ChaliceViewError as e:
+        return error(e)
+
+    context = {'identity': {'sourceIp': source_ip}}
+
+    return call(route, params,
+                create_request(route, params, method, query, headers, body,
+                               context),
+                local)
+
+
+def encode(response: Response,
+           encoder: JsonEncoder) -> Tuple[int, List[Tuple[bytes, bytes]],
+                                          bytes]:
+    """Converts the response into a status, raw headers and a raw body."""
+
+    body = response.body
+    headers = dict(response.headers)
+
+    if not isinstance(body, (str, bytes)):
+        body = encoder(body)
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+
+    if not any(x.lower() == 'content-type' for x in headers):
+        headers['Content-Type'] = 'application/json'
+
+    raw = []
+    for k, v in headers.items():
+        for x in (v if isinstance(v, list) else [v]):
+            raw.append((k.encode('latin-1'), str(x).encode('latin-1')))
+    raw.append((b'Content-Length', str(len(body)).encode('latin-1')))
+
+    return response.status_code, raw, body
+
+
+async def _lifespan(receive: Callable, send: Callable):
+    while True:
+        message = await receive()
+
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
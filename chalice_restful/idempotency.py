@@ -0,0 +1,180 @@
+import json
+from functools import wraps
+from hashlib import sha256
+from typing import Any, Callable, Dict, Optional
+
+from chalice.app import (ConflictError, Request, Response,
+                         UnprocessableEntityError)
+
+from chalice_restful.caching import LruCache
+from chalice_restful.common.guards import ensure
+from chalice_restful.configs import config
+from chalice_restful.serialization import JsonEncoder, encode_chalice_json
+
+
+class Idempotency:
+    """Storage and lifetime of replayed responses, see `idempotent`."""
+
+    methods = ['POST', 'PUT', 'PATCH']
+
+    def __init__(self, ttl: float, lock_ttl: float, header: str, store: Any):
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.header = header
+        self.store = store
+
+    def key(self, request: Request, params: dict) -> Optional[tuple]:
+        """Builds a key of the request, or `None` if it has no header.
+
+        The key includes the client (its authorized principal and API key),
+        so a client can't get a response stored for another one.
+        """
+
+        value = request.headers.get(self.header)
+        if not value:
+            return None
+
+        context = request.context or {}
+        client = json.dumps([context.get('authorizer'),
+                             context.get('identity', {}).get('apiKey')],
+                            sort_keys=True, default=str)
+
+        return (value, sha256(client.encode('utf-8')).hexdigest(),
+                request.method, context.get('resourcePath'),
+                tuple(sorted(params.items())))
+
+
+@config
+def idempotent(ttl: float = 86400,
+               lock_ttl: float = 900,
+               max_entries: int = 1024,
+               header: str = 'Idempotency-Key',
+               store: Any = None) -> Idempotency:
+    """Replays responses of a decorated endpoint or resource on retries.
+
+    When a request carries the `Idempotency-Key` header, the response
+    of the endpoint is stored, and retries with the same key get
+    the stored response without running the endpoint again:
+        @route('/v1/orders')
+        @idempotent(ttl=86400)
+        class Orders(Resource):
+            def post(): ...
+
+    Replayed responses have the `Idempotent-Replayed: true` header.
+    A retry that arrives while the first request is still handled
+    (e.g. after a timeout of API Gateway) is rejected with `409 Conflict`,
+    and one with a different body with `422 Unprocessable Entity`.
+    Errors and `5xx` responses aren't stored, so they can be retried.
+
+    Only `post`, `put` and `patch` endpoints are replayed.
+
+    Responses are kept in the memory of a container by default, so
+    only retries that reach the same container are replayed. Pass
+    a persistent `store` (e.g. backed by DynamoDB) to replay them
+    across all containers; it should implement `get(key)`,
+    `put(key, value, ttl)`, `delete(key)` and an atomic `add(key, value,
+    ttl)` that adds only absent keys (e.g. a conditional write), like
+    `LruCache`, which can stand in for it in tests.
+
+    Args:
+        ttl: Number of seconds a response is stored for.
+        lock_ttl: Number of seconds a request is considered in progress
+            for, in case its container dies before it's handled.
+        max_entries: Maximum number of responses kept in memory.
+        header: Name of a header the key is read from.
+        store: Storage of responses, `LruCache` by default.
+    """
+
+    ensure(ttl).is_positive()
+    ensure(lock_ttl).is_positive()
+    ensure(max_entries).is_positive()
+
+    return Idempotency(ttl, lock_ttl, header.lower(),
+                       store if store is not None else
+                       LruCache(max_entries, ttl))
+
+
+def replay(handler: Callable, idempotency: Idempotency,
+           request: Callable[[], Request],
+           encoder: JsonEncoder = None) -> Callable:
+    """Wraps the handler, so its responses are replayed on retries.
+
+    Args:
+        handler: Endpoint to wrap.
+        idempotency: Rules of replaying.
+        request: Function that returns an incoming HTTP-request.
+        encoder: Function that serializes a value to a JSON string,
+            the Chalice serialization is used by default.
+    """
+
+    encoder = encoder or encode_chalice_json
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        current = request()
+
+        key = idempotency.key(current, kwargs)
+        if key is None:
+            return handler(*args, **kwargs)
+
+        fingerprint = sha256(current.raw_body or b'').hexdigest()
+        store = idempotency.store
+
+        # The request is marked as in progress before the handler
+        # is called, so concurrent retries don't call it again.
+        lock = {'fingerprint': fingerprint, 'status': None}
+        if not store.add(key, lock, idempotency.lock_ttl):
+            return _replay(store.get(key), fingerprint)
+
+        try:
+            response = handler(*args, **kwargs)
+        except BaseException:
+            store.delete(key)
+            raise
+
+        if not isinstance(response, Response):
+            response = Response(body=response)
+
+        if response.status_code < 500:
+            store.put(key, _record(response, fingerprint, encoder),
+                      idempotency.ttl)
+        else:
+            store.delete(key)
+
+        return response
+
+    return body
+
+
+def _replay(record: Optional[Dict[str, Any]],
+            fingerprint: str) -> Response:
+    # The record can be deleted right after it's checked, when the first
+    # request fails, so it's treated as still in progress.
+    if record is None:
+        raise ConflictError('Request with the same idempotency key '
+                            'is in progress')
+
+    if record['fingerprint'] != fingerprint:
+        raise UnprocessableEntityError(
+            'Idempotency key is reused with a different request')
+
+    if record['status'] is None:
+        raise ConflictError('Request with the same idempotency key '
+                            'is in progress')
+
+    return Response(
+        body=record['body'],
+        headers={**record['headers'], 'Idempotent-Replayed': 'true'},
+        status_code=record['status'])
+
+
+def _record(response: Response, fingerprint: str,
+            encoder: JsonEncoder) -> Dict[str, Any]:
+    body = response.body
+    if not isinstance(body, (str, bytes)):
+        body = encoder(body)
+
+    return {'fingerprint': fingerprint,
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'body': body}
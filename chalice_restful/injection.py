@@ -0,0 +1,65 @@
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List
+
+
+class Provider:
+    """A factory of a dependency injected into endpoints by its name.
+
+    Instances of this class are created by `Api.provide`. Dependencies
+    of the `container` scope are created once, on the first use, and
+    shared by all requests handled by the same container; dependencies
+    of the `request` scope are created for every request.
+    """
+
+    scopes = ['container', 'request']
+
+    def __init__(self, factory: Callable[[], Any], scope: str):
+        self.factory = factory
+        self.scope = scope
+        self.lock = Lock()
+        self.instances = []
+
+    def get(self) -> Any:
+        """Returns the dependency, creating it if needed."""
+
+        if self.scope == 'request':
+            return self.factory()
+
+        if not self.instances:
+            with self.lock:
+                if not self.instances:
+                    self.instances.append(self.factory())
+
+        return self.instances[0]
+
+
+def dependencies(parameters: Iterable[str]) -> List[str]:
+    """Returns names of the parameters except `self`."""
+
+    return [x for x in parameters if x != 'self']
+
+
+def inject(handler: Callable, names: List[str],
+           providers: Dict[str, Provider]) -> Callable:
+    """Wraps the handler, so the provided dependencies are passed to it.
+
+    A parameter is injected only if it has a provider and isn't passed
+    already (e.g. as a path parameter). Providers are looked up
+    on every call, so they can be added after the endpoint.
+
+    Args:
+        handler: Endpoint to wrap.
+        names: Names of the parameters of the endpoint.
+        providers: Providers of dependencies by their names.
+    """
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        for x in names:
+            if x not in kwargs and x in providers:
+                kwargs[x] = providers[x].get()
+
+        return handler(*args, **kwargs)
+
+    return body
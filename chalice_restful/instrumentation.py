@@ -0,0 +1,160 @@
+import json
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter, time
+from typing import Any, Callable, List, NamedTuple, Optional, TextIO
+
+from chalice.app import Response
+
+from chalice_restful.endpoints import Endpoint
+
+_cold = True
+
+
+class Measurement(NamedTuple):
+    """A single invocation of an endpoint.
+
+    Instances of this class are passed to an instrumentation sink
+    after each invocation of an endpoint.
+
+    The `size` is known only if the body is already serialized
+    (e.g. by the `json_encoder` of the `Api`), because serializing it
+    again just to measure it would double the cost of every response.
+    """
+
+    resource: str
+    route: str
+    method: str
+    duration: float
+    size: Optional[int]
+    error: Optional[str]
+    cold: bool
+
+
+class Histogram:
+    """An in-memory instrumentation sink.
+
+    Keeps all measurements and counts durations of each endpoint
+    in buckets, which is mostly useful in tests and local runs:
+        histogram = Histogram()
+        api = Api(app, instrumentation=histogram)
+        ...
+        print(histogram.counts[('Items', '/v1/items', 'GET')])
+    """
+
+    bounds = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    """Upper bounds of the buckets in milliseconds."""
+
+    def __init__(self):
+        self.measurements: List[Measurement] = []
+        self.counts = defaultdict(lambda: [0] * (len(self.bounds) + 1))
+
+    def __call__(self, measurement: Measurement):
+        key = (measurement.resource, measurement.route, measurement.method)
+        bucket = bisect_left(self.bounds, measurement.duration * 1000)
+
+        self.measurements.append(measurement)
+        self.counts[key][bucket] += 1
+
+
+class EmbeddedMetrics:
+    """An instrumentation sink that prints CloudWatch metrics.
+
+    Each measurement is printed as a line in the CloudWatch Embedded
+    Metric Format, so Lambda logs are turned into metrics without
+    any API calls:
+        api = Api(app, instrumentation=EmbeddedMetrics('Example'))
+
+    Read more: https://docs.aws.amazon.com/AmazonCloudWatch/latest/monitoring/CloudWatch_Embedded_Metric_Format.html.
+    """
+
+    metrics = [
+        {'Name': 'Duration', 'Unit': 'Milliseconds'},
+        {'Name': 'ResponseSize', 'Unit': 'Bytes'},
+        {'Name': 'Errors', 'Unit': 'Count'},
+        {'Name': 'ColdStarts', 'Unit': 'Count'},
+    ]
+
+    def __init__(self, namespace: str = 'ChaliceRestful',
+                 stream: TextIO = None):
+        self.namespace = namespace
+        self.stream = stream
+
+    def __call__(self, measurement: Measurement):
+        metrics = self.metrics
+        values = {
+            'Duration': measurement.duration * 1000,
+            'ResponseSize': measurement.size,
+            'Errors': int(measurement.error is not None),
+            'ColdStarts': int(measurement.cold),
+        }
+
+        # Sizes of bodies that aren't serialized yet are unknown,
+        # so they're omitted instead of being reported as zeros.
+        if measurement.size is None:
+            del values['ResponseSize']
+            metrics = [x for x in metrics if x['Name'] in values]
+
+        line = {
+            '_aws': {
+                'Timestamp': int(time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': self.namespace,
+                    'Dimensions': [['Resource', 'Route', 'Method']],
+                    'Metrics': metrics,
+                }],
+            },
+            'Resource': measurement.resource,
+            'Route': measurement.route,
+            'Method': measurement.method,
+            **values,
+        }
+
+        print(json.dumps(line), file=self.stream or sys.stdout)
+
+
+def instrument(handler: Callable, endpoint: Endpoint,
+               sink: Callable[[Measurement], Any]) -> Callable:
+    """Wraps the handler, so each invocation is measured.
+
+    Args:
+        handler: Endpoint to wrap.
+        endpoint: Resolved endpoint the measurements are tagged with.
+        sink: Function that receives a `Measurement`.
+    """
+
+    tags = (endpoint.resource.__name__, endpoint.path, endpoint.method)
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        global _cold
+
+        cold, _cold = _cold, False
+        response, error = None, None
+        start = perf_counter()
+
+        try:
+            response = handler(*args, **kwargs)
+            return response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = perf_counter() - start
+            sink(Measurement(*tags, duration, _size(response), error, cold))
+
+    return body
+
+
+def _size(response: Any) -> Optional[int]:
+    if isinstance(response, Response):
+        response = response.body
+
+    if isinstance(response, bytes):
+        return len(response)
+    if isinstance(response, str):
+        return len(response.encode('utf-8'))
+
+    return None
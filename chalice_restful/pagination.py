@@ -0,0 +1,191 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error
+from functools import wraps
+from inspect import signature
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from chalice.app import BadRequestError, ChaliceViewError, Request, Response
+
+from chalice_restful.common.guards import ensure
+from chalice_restful.common.loop import event_loop
+from chalice_restful.configs import config
+from chalice_restful.serialization import JsonEncoder, encode_chalice_json
+
+
+class Pagination:
+    """Page size limits of `paginated`."""
+
+    def __init__(self, limit: int, max_limit: int, max_bytes: int):
+        self.limit = limit
+        self.max_limit = max_limit
+        self.max_bytes = max_bytes
+
+
+@config
+def paginated(limit: int = 100,
+              max_limit: int = 1000,
+              max_bytes: int = 5 * 1024 * 1024) -> Pagination:
+    """Splits a collection returned by a decorated `get` into pages.
+
+    The endpoint should return an iterator (usually a generator)
+    or an async iterator instead of a list, so items are produced
+    one by one and never kept in memory all together:
+        @route('/v1/items')
+        class Items(Resource):
+            @paginated(limit=100)
+            def get():
+                for x in table.scan():
+                    yield x
+
+    Clients request pages with the `limit` and `cursor` query parameters
+    and receive a JSON object with the `items` of the page and
+    the `next` cursor, which is `null` for the last page.
+
+    By default, items of previous pages are produced and skipped again
+    for every page. To resume the collection where the previous page ended
+    instead, accept a `cursor` argument, which is `None` for the first
+    page, and yield `(cursor, item)` pairs, where the cursor is
+    a JSON serializable position right after the item:
+        @paginated(limit=100)
+        def get(cursor):
+            for x in table.scan(start_after=cursor):
+                yield x['id'], x
+
+    Items are serialized one by one, and the page ends early
+    if it would exceed `max_bytes`, so responses always fit
+    into API Gateway and Lambda payload limits.
+
+    Args:
+        limit: Number of items in a page by default.
+        max_limit: Maximum number of items a client can request.
+        max_bytes: Maximum size of a serialized page.
+    """
+
+    ensure(limit).is_positive()
+    ensure(max_limit).is_positive()
+    ensure(max_bytes).is_positive()
+
+    return Pagination(limit, max_limit, max_bytes)
+
+
+def paginate(handler: Callable, pagination: Pagination,
+             request: Callable[[], Request],
+             encoder: JsonEncoder = None) -> Callable:
+    """Wraps the handler, so the iterator it returns is paginated.
+
+    If the handler accepts a `cursor` argument, it gets the decoded cursor
+    of the requested page and yields `(cursor, item)` pairs, otherwise
+    the items of previous pages are skipped.
+
+    Args:
+        handler: Endpoint to wrap.
+        pagination: Rules of pagination.
+        request: Function that returns an incoming HTTP-request.
+        encoder: Function that serializes an item to a JSON string,
+            the Chalice serialization is used by default.
+    """
+
+    encoder = encoder or encode_chalice_json
+    resumable = 'cursor' in signature(handler).parameters
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        query = request().query_params or {}
+
+        if resumable:
+            position = _position(query.get('cursor'), None)
+            items = handler(*args, cursor=position, **kwargs)
+        else:
+            items = handler(*args, **kwargs)
+
+        if not _is_iterator(items):
+            return items
+
+        limit = _limit(query.get('limit'), pagination)
+
+        if hasattr(items, '__anext__'):
+            items = _synchronous(items)
+
+        if not resumable:
+            offset = _position(query.get('cursor'), 0)
+            if not isinstance(offset, int) or offset < 0:
+                raise BadRequestError('Invalid cursor')
+
+            items = enumerate(islice(items, offset, None), offset + 1)
+
+        page, position = _page(items, limit, pagination.max_bytes, encoder)
+        cursor = None if position is None else _cursor(position)
+
+        return Response(
+            body='{"items":[' + ','.join(page) + '],"next":' +
+                 json.dumps(cursor) + '}',
+            headers={'Content-Type': 'application/json'})
+
+    return body
+
+
+def _page(items: Iterator[Tuple[Any, Any]], limit: int, max_bytes: int,
+          encoder: JsonEncoder) -> Tuple[List[str], Any]:
+    # Length of the `{"items":[],"next":"..."}` envelope is reserved.
+    size = 64
+    page = []
+    position = None
+
+    for next_position, x in items:
+        if len(page) == limit:
+            return page, position
+
+        chunk = encoder(x)
+        size += len(chunk.encode('utf-8')) + 1
+
+        if size > max_bytes:
+            if not page:
+                raise ChaliceViewError('Item is too large to be returned')
+            return page, position
+
+        page.append(chunk)
+        position = next_position
+
+    return page, None
+
+
+def _is_iterator(x: Any) -> bool:
+    return hasattr(x, '__next__') or hasattr(x, '__anext__')
+
+
+def _synchronous(items: Any) -> Iterator:
+    loop = event_loop()
+
+    while True:
+        try:
+            yield loop.run_until_complete(items.__anext__())
+        except StopAsyncIteration:
+            return
+
+
+def _limit(value: Optional[str], pagination: Pagination) -> int:
+    if value is None:
+        return pagination.limit
+
+    if not value.isdigit() or not 0 < int(value) <= pagination.max_limit:
+        raise BadRequestError(
+            f'Expected limit to be between 1 and {pagination.max_limit}')
+
+    return int(value)
+
+
+def _position(cursor: Optional[str], default: Any) -> Any:
+    if cursor is None:
+        return default
+
+    try:
+        return json.loads(urlsafe_b64decode(cursor.encode('ascii')))
+    except (Error, ValueError):
+        raise BadRequestError('Invalid cursor')
+
+
+def _cursor(position: Any) -> str:
+    return urlsafe_b64encode(json.dumps(position).encode('utf-8')) \
+        .decode('ascii')
@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from functools import wraps
+from math import ceil
+from threading import Lock
+from time import monotonic
+from typing import Callable, Hashable, Union
+
+from chalice.app import ForbiddenError, Request, TooManyRequestsError
+
+from chalice_restful.common.errors import error
+from chalice_restful.common.guards import ensure
+from chalice_restful.configs import config
+
+
+class LocalBuckets:
+    """Token buckets kept in the memory of a container.
+
+    Each key has its own bucket of `burst` tokens, refilled at the rate
+    of `per_second` tokens a second. When there are more than
+    `max_entries` buckets, the least recently used one is evicted,
+    which is the same as if its client was idle long enough to refill.
+
+    This is the default store of the `rate_limit` decorator. A shared
+    store (e.g. backed by Redis or DynamoDB) can be used instead,
+    so all containers enforce the same limit; it should implement
+    the same `take` method, and this class can stand in for it in tests.
+    """
+
+    def __init__(self, max_entries: int = 10000,
+                 clock: Callable[[], float] = monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self.buckets = OrderedDict()
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def take(self, key: Hashable, per_second: float, burst: int) -> float:
+        """Takes a token from the bucket of the key.
+
+        Returns:
+            Zero if the token is taken, otherwise a number of seconds
+            until the next token is available.
+        """
+
+        with self.lock:
+            now = self.clock()
+            tokens, updated = self.buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * per_second)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0
+            else:
+                wait = (1 - tokens) / per_second
+
+            self.buckets[key] = (tokens, now)
+            self.buckets.move_to_end(key)
+
+            while len(self.buckets) > self.max_entries:
+                self.buckets.popitem(last=False)
+
+            return wait
+
+
+class RateLimit:
+    """Rate, burst and client key of `rate_limit`."""
+
+    def __init__(self, per_second: float, burst: int,
+                 key: Callable[[Request], Hashable], store: LocalBuckets):
+        self.per_second = per_second
+        self.burst = burst
+        self.key = key
+        self.store = store
+
+
+@config
+def rate_limit(per_second: float,
+               burst: int = None,
+               key: Union[str, Callable[[Request], Hashable]] = 'source_ip',
+               store: LocalBuckets = None) -> RateLimit:
+    """Limits the rate of requests to a decorated endpoint or resource.
+
+    Every client gets a token bucket of `burst` requests, refilled
+    at the rate of `per_second` requests a second. Requests beyond
+    the limit are rejected with `429 Too Many Requests` and
+    a `Retry-After` header before the endpoint is called:
+        @route('/v1/reports')
+        @rate_limit(per_second=5, burst=10, key='api_key')
+        class Reports(Resource):
+            def get(): ...
+
+    When a resource is decorated, all its endpoints share the buckets.
+
+    Clients are identified by the `sourceIp` or the `apiKey` validated
+    by API Gateway, never by headers a client can forge. Behind a proxy
+    that overwrites the `X-Forwarded-For` header, `forwarded_for` can be
+    used instead. Requests whose client can't be identified (e.g. without
+    an API key) are rejected with `403 Forbidden`, so they don't share
+    a single bucket.
+
+    Buckets are kept in the memory of a container by default, so
+    every container enforces the limit on its own. Pass a shared
+    `store` to enforce it across all of them.
+
+    Args:
+        per_second: Number of requests a second a client can make.
+        burst: Number of requests a client can make at once,
+            `per_second` (rounded up) by default.
+        key: Identifies a client: `source_ip`, `api_key`, `forwarded_for`
+            or a function that returns a key of a request.
+        store: Token buckets, `LocalBuckets` by default.
+    """
+
+    ensure(per_second).is_positive()
+
+    burst = ceil(per_second) if burst is None else burst
+    ensure(burst).is_positive()
+
+    if not callable(key):
+        ensure(key).is_in(list(_keys))
+        key = _keys[key]
+
+    return RateLimit(per_second, burst, key, store or LocalBuckets())
+
+
+def limit(handler: Callable, rate_limit: RateLimit,
+          request: Callable[[], Request]) -> Callable:
+    """Wraps the handler, so excess requests are rejected.
+
+    Args:
+        handler: Endpoint to wrap.
+        rate_limit: Rules of rate limiting.
+        request: Function that returns an incoming HTTP-request.
+    """
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        key = rate_limit.key(request())
+        if key is None:
+            return error(ForbiddenError('Client of the request '
+                                        "can't be identified"))
+
+        wait = rate_limit.store.take(key, rate_limit.per_second,
+                                     rate_limit.burst)
+        if wait > 0:
+            response = error(TooManyRequestsError('Rate limit exceeded'))
+            response.headers['Retry-After'] = str(ceil(wait))
+            return response
+
+        return handler(*args, **kwargs)
+
+    return body
+
+
+def _source_ip(request: Request) -> Hashable:
+    return request.context.get('identity', {}).get('sourceIp')
+
+
+def _api_key(request: Request) -> Hashable:
+    return request.context.get('identity', {}).get('apiKey')
+
+
+def _forwarded_for(request: Request) -> Hashable:
+    # The proxy appends the address of its client, so only the last one
+    # can be trusted, while the ones before it are sent by the client.
+    forwarded = request.headers.get('x-forwarded-for') or ''
+
+    return forwarded.rpartition(',')[2].strip() or None
+
+
+_keys = {'source_ip': _source_ip, 'api_key': _api_key,
+         'forwarded_for': _forwarded_for}
@@ -0,0 +1,124 @@
+from typing import (Any, Callable, Dict, List, Mapping, NamedTuple, Optional,
+                    Tuple)
+
+from chalice.app import MethodNotAllowedError, NotFoundError
+
+
+class Route(NamedTuple):
+    """A handler registered in the `Chalice` instance by the `Api`."""
+
+    path: str
+    method: str
+    handler: Callable
+    options: Mapping[str, Any]
+
+
+class _Node:
+    __slots__ = ('static', 'param', 'routes', 'names')
+
+    def __init__(self):
+        self.static: Dict[str, _Node] = {}
+        self.param: Optional[_Node] = None
+        self.routes: Dict[str, Route] = {}
+        self.names: Tuple[str] = ()
+
+
+class RouteTable:
+    """All routes registered by the `Api`, by path and HTTP-method.
+
+    Routes are kept in a radix tree over the segments of their paths,
+    so a route of a concrete path like `/v1/items/1` is found in-process
+    in time proportional to the number of segments, without going
+    through Chalice or API Gateway.
+
+    Static segments take precedence over path parameters, so
+    `/v1/items/new` is matched before `/v1/items/{id}`.
+    """
+
+    def __init__(self):
+        self.root = _Node()
+        self.paths: List[str] = []
+
+    def add(self, route: Route):
+        """Adds the route to the table."""
+
+        node = self.root
+        names = []
+
+        for x in _segments(route.path):
+            if x.startswith('{') and x.endswith('}'):
+                node.param = node.param or _Node()
+                node = node.param
+                names.append(x[1:-1])
+            else:
+                node = node.static.setdefault(x, _Node())
+
+        if not node.routes:
+            self.paths.append(route.path)
+
+        node.routes[route.method] = route
+        node.names = tuple(names)
+
+    def match(self, path: str) -> Optional[Tuple[Dict[str, Route],
+                                                 Dict[str, str]]]:
+        """Finds routes of all HTTP-methods by the concrete path.
+
+        Returns:
+            Routes by HTTP-method and path parameters,
+            or `None` if nothing matches.
+        """
+
+        values = []
+        node = _match(self.root, _segments(path), 0, values)
+
+        if node is None:
+            return None
+
+        return node.routes, dict(zip(node.names, values))
+
+    def resolve(self, method: str, path: str) -> Tuple[Route, Dict[str, str]]:
+        """Finds a route by the HTTP-method and the concrete path.
+
+        Raises:
+            NotFoundError: Raised if no route matches the path.
+            MethodNotAllowedError: Raised if the route doesn't
+                support the HTTP-method.
+        """
+
+        matched = self.match(path)
+        if matched is None:
+            raise NotFoundError(f'No route for: {path}')
+
+        routes, params = matched
+        if method not in routes:
+            raise MethodNotAllowedError(f'Unsupported method: {method}')
+
+        return routes[method], params
+
+
+def _segments(path: str) -> List[str]:
+    path = path.strip('/')
+    return path.split('/') if path else []
+
+
+def _match(node: _Node, segments: List[str], i: int,
+           values: List[str]) -> Optional[_Node]:
+    if i == len(segments):
+        return node if node.routes else None
+
+    segment = segments[i]
+
+    child = node.static.get(segment)
+    if child is not None:
+        matched = _match(child, segments, i + 1, values)
+        if matched is not None:
+            return matched
+
+    if node.param is not None and segment:
+        values.append(segment)
+        matched = _match(node.param, segments, i + 1, values)
+        if matched is not None:
+            return matched
+        values.pop()
+
+    return None
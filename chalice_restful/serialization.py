@@ -0,0 +1,106 @@
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Callable
+
+from chalice.app import Response, handle_extra_types
+
+orjson: Any = ...
+"""The `orjson` module, or `None` if it isn't installed.
+
+It's imported on the first call of `encode_json`, not on cold starts.
+"""
+
+JsonEncoder = Callable[[Any], str]
+"""A function that serializes a value to a JSON string."""
+
+
+def encode_json(value: Any) -> str:
+    """Serializes the value to a JSON string.
+
+    Uses `orjson` when it's installed, and the standard `json` module
+    otherwise (or for values `orjson` can't encode, e.g. integers
+    over 64 bits). Besides the JSON types, both backends support:
+        a) `datetime`, `date` and `time` (in the ISO 8601 format);
+        b) `Decimal` (as integers when integral, e.g. from DynamoDB);
+        c) dataclasses and sets;
+        d) keys of dictionaries that aren't strings (e.g. integers).
+
+    This function is meant to be used as `json_encoder` of the `Api`:
+        api = Api(app, json_encoder=encode_json)
+    """
+
+    backend = _orjson()
+
+    if backend is not None:
+        try:
+            return backend.dumps(value, default=_default,
+                                 option=backend.OPT_NON_STR_KEYS) \
+                .decode('utf-8')
+        except TypeError:
+            pass
+
+    return json.dumps(value, separators=(',', ':'), default=_default)
+
+
+def encode_chalice_json(value: Any) -> str:
+    """Serializes the value to a JSON string the same way Chalice does."""
+
+    return json.dumps(value, separators=(',', ':'), default=handle_extra_types)
+
+
+def serialize(handler: Callable, encoder: JsonEncoder) -> Callable:
+    """Wraps the handler, so its responses are serialized by the encoder.
+
+    Strings and bytes are returned as is, like Chalice does.
+
+    Args:
+        handler: Endpoint to wrap.
+        encoder: Function that serializes a value to a JSON string.
+    """
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        response = handler(*args, **kwargs)
+
+        if isinstance(response, Response):
+            if not isinstance(response.body, (str, bytes)):
+                response.body = encoder(response.body)
+            return response
+
+        if isinstance(response, (str, bytes)):
+            return response
+
+        return Response(body=encoder(response))
+
+    return body
+
+
+def _orjson() -> Any:
+    global orjson
+
+    if orjson is ...:
+        try:
+            import orjson as module
+        except ImportError:  # pragma: no cover
+            module = None
+
+        orjson = module
+
+    return orjson
+
+
+def _default(x: Any) -> Any:
+    if isinstance(x, Decimal):
+        return int(x) if x == x.to_integral_value() else float(x)
+    if isinstance(x, (datetime, date, time)):
+        return x.isoformat()
+    if is_dataclass(x) and not isinstance(x, type):
+        return asdict(x)
+    if isinstance(x, (set, frozenset)):
+        return list(x)
+
+    raise TypeError(f'Object of type {type(x).__name__} '
+                    f'is not JSON serializable')
@@ -0,0 +1,191 @@
+from functools import wraps
+from threading import Thread
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from chalice.app import ChaliceViewError, Request
+
+from chalice_restful.common.guards import ensure
+from chalice_restful.configs import config
+
+
+class ServiceUnavailableError(ChaliceViewError):
+    STATUS_CODE = 503
+
+
+class GatewayTimeoutError(ChaliceViewError):
+    STATUS_CODE = 504
+
+
+class Deadline:
+    """A moment by which a request should be handled.
+
+    Handlers get the deadline of the current request as `api.deadline`
+    and pass the remaining time to their downstream calls:
+        table.query(..., timeout=api.deadline.remaining())
+    """
+
+    def __init__(self, at: float, clock: Callable[[], float] = monotonic):
+        self.at = at
+        self.clock = clock
+
+    def remaining(self) -> float:
+        """Returns a number of seconds left until the deadline."""
+
+        return max(0.0, self.at - self.clock())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+
+        return self.remaining() == 0
+
+    @staticmethod
+    def after(seconds: float,
+              clock: Callable[[], float] = monotonic) -> 'Deadline':
+        """Creates a deadline the specified number of seconds from now."""
+
+        return Deadline(clock() + seconds, clock)
+
+
+@config
+def timeout(seconds: float) -> float:
+    """Limits the time a decorated endpoint or resource is handled for.
+
+    The deadline of a request is the configured timeout or the remaining
+    time of the Lambda invocation, whichever comes first. Handlers get it
+    as `api.deadline` and should pass it to their downstream calls:
+        @route('/v1/reports')
+        @timeout(5)
+        class Reports(Resource):
+            def get():
+                return client.fetch(timeout=api.deadline.remaining())
+
+    If the deadline passes before the endpoint returns, the request
+    is answered with `504 Gateway Timeout` right away, so it doesn't
+    hold the Lambda until the hard timeout. Requests that arrive with
+    no time left are answered with `503 Service Unavailable`.
+
+    Python threads can't be killed, so a handler that ignores
+    the deadline keeps running in the background until it returns.
+
+    Args:
+        seconds: Maximum number of seconds a request is handled for.
+    """
+
+    ensure(seconds).is_positive()
+
+    return seconds
+
+
+def remaining(lambda_context: Any) -> Optional[float]:
+    """Returns a number of seconds left until the Lambda times out.
+
+    Returns `None` if the handler isn't invoked by Lambda.
+    """
+
+    if lambda_context is None:
+        return None
+
+    try:
+        return lambda_context.get_remaining_time_in_millis() / 1000
+    except TypeError:
+        # `chalice local` without a `lambda_timeout` has no runtime limit.
+        return None
+
+
+def limit_time(handler: Callable, seconds: float,
+               lambda_context: Callable[[], Any], local: Any,
+               request: Callable[[], Request]) -> Callable:
+    """Wraps the handler, so requests are answered with an error on time.
+
+    The handler is called in a separate thread, which gets the state
+    of the `local` of the calling thread, the `deadline` and the current
+    `request`. The thread isn't stopped on the deadline and keeps running
+    until the handler returns, possibly during later invocations of the
+    Lambda, so its request is pinned and `api.request` never returns
+    a request of another client there. Coroutine functions should be
+    wrapped with `limit_coroutine_time` instead, which cancels them.
+
+    Args:
+        handler: Endpoint to wrap.
+        seconds: Maximum number of seconds the handler is called for.
+        lambda_context: Function that returns a context of the current
+            Lambda invocation, if there is one.
+        local: Thread-local state of the `Api`.
+        request: Function that returns an incoming HTTP-request.
+    """
+
+    @wraps(handler)
+    def body(*args, **kwargs):
+        budget = _budget(seconds, lambda_context())
+        state = {**vars(local), 'request': request(),
+                 'deadline': Deadline.after(budget)}
+        result = {}
+
+        def run():
+            vars(local).update(state)
+            try:
+                result['value'] = handler(*args, **kwargs)
+            except BaseException as e:
+                result['error'] = e
+
+        thread = Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(budget)
+
+        if thread.is_alive():
+            raise GatewayTimeoutError('Request timed out')
+        if 'error' in result:
+            raise result['error']
+
+        return result['value']
+
+    return body
+
+
+def limit_coroutine_time(handler: Callable, seconds: float,
+                         lambda_context: Callable[[], Any],
+                         local: Any) -> Callable:
+    """Wraps the coroutine function, so it's cancelled on the deadline.
+
+    Unlike `limit_time`, the coroutine is awaited on the event loop
+    of the calling thread, so the loop shared by all invocations
+    of the container is kept, and the coroutine is actually cancelled.
+
+    Args:
+        handler: Coroutine function to wrap.
+        seconds: Maximum number of seconds the handler is awaited for.
+        lambda_context: Function that returns a context of the current
+            Lambda invocation, if there is one.
+        local: Thread-local state of the `Api`.
+    """
+
+    from asyncio import TimeoutError, wait_for
+
+    @wraps(handler)
+    async def body(*args, **kwargs):
+        budget = _budget(seconds, lambda_context())
+        previous = getattr(local, 'deadline', None)
+        local.deadline = Deadline.after(budget)
+
+        try:
+            return await wait_for(handler(*args, **kwargs), budget)
+        except TimeoutError:
+            raise GatewayTimeoutError('Request timed out')
+        finally:
+            local.deadline = previous
+
+    return body
+
+
+def _budget(seconds: float, lambda_context: Any) -> float:
+    budget = seconds
+    left = remaining(lambda_context)
+    if left is not None:
+        budget = min(budget, left)
+
+    if budget <= 0:
+        raise ServiceUnavailableError('No time left to handle request')
+
+    return budget
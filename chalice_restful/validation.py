@@ -0,0 +1,196 @@
+from dataclasses import MISSING, fields, is_dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, List, Type, Union, get_type_hints
+
+from chalice.app import BadRequestError, Request
+
+from chalice_restful.configs import config
+
+Validator = Callable[[Any, str, List[str]], Any]
+"""A function that validates a value at the path and collects errors."""
+
+
+@config
+def body(schema: Type):
+    """Validates a JSON body of requests to a decorated endpoint or resource.
+
+    The `schema` should be a dataclass or a `NamedTuple`, and its fields
+    can be annotated with `str`, `int`, `float`, `bool`, `list`, `dict`,
+    `Any`, other schemas, or `List`, `Dict` and `Optional` of them:
+        @dataclass
+        class Item:
+            name: str
+            tags: List[str] = field(default_factory=list)
+
+    The body is validated before the endpoint is called, and an instance
+    of the schema is passed to the endpoint as the `body` argument:
+        @route('/v1/items')
+        class Items(Resource):
+            @body(Item)
+            def post(body: Item): ...
+
+    If the body is invalid, a `BadRequestError` listing all the errors
+    is raised, so the endpoint isn't called at all.
+
+    Only `post`, `put` and `patch` endpoints are affected.
+
+    The schema is compiled into a validator once, when the endpoint
+    is added to the `Api`.
+    """
+
+    assert _is_schema(schema), \
+        f'Expected {schema} to be a dataclass or a `NamedTuple`'
+
+
+def compile_schema(schema: Type) -> Callable[[Any], Any]:
+    """Compiles the schema into a validator of JSON values.
+
+    The schema is inspected only once, so validation of each
+    request doesn't involve any reflection.
+
+    Raises:
+        AssertionError: Raised if the schema (or any of
+            its fields) has an unsupported type.
+    """
+
+    validator = _compile(schema)
+
+    def validate(value: Any) -> Any:
+        errors = []
+        result = validator(value, 'body', errors)
+
+        if errors:
+            raise BadRequestError('; '.join(errors))
+
+        return result
+
+    return validate
+
+
+def validate(handler: Callable, schema: Type,
+             request: Callable[[], Request]) -> Callable:
+    """Wraps the handler, so it receives a validated body.
+
+    Args:
+        handler: Endpoint to wrap.
+        schema: Schema of the body.
+        request: Function that returns an incoming HTTP-request.
+    """
+
+    validator = compile_schema(schema)
+
+    @wraps(handler)
+    def validated(*args, **kwargs):
+        value = validator(request().json_body)
+        return handler(*args, body=value, **kwargs)
+
+    return validated
+
+
+def _compile(t: Any) -> Validator:
+    if t is Any:
+        return lambda x, path, errors: x
+
+    origin = getattr(t, '__origin__', None)
+    args = getattr(t, '__args__', ())
+
+    if origin is Union:
+        return _union(args)
+    if origin is list or t is list:
+        return _list(_compile(args[0]) if args else _compile(Any))
+    if origin is dict or t is dict:
+        return _dict(_compile(args[1]) if args else _compile(Any))
+    if t in (str, int, float, bool):
+        return _primitive(t)
+    if _is_schema(t):
+        return _schema(t)
+
+    assert False, f'Expected {t} to be a supported schema type'
+
+
+def _union(args: tuple) -> Validator:
+    inner = [x for x in args if x is not type(None)]
+
+    assert len(inner) == 1, \
+        f'Expected {args} to be an `Optional` of a single type'
+
+    validator = _compile(inner[0])
+
+    def validate(x, path, errors):
+        return None if x is None else validator(x, path, errors)
+
+    return validate
+
+
+def _list(item: Validator) -> Validator:
+    def validate(x, path, errors):
+        if not isinstance(x, list):
+            errors.append(f'Expected {path} to be a list')
+            return x
+
+        return [item(v, f'{path}[{i}]', errors) for i, v in enumerate(x)]
+
+    return validate
+
+
+def _dict(value: Validator) -> Validator:
+    def validate(x, path, errors):
+        if not isinstance(x, dict):
+            errors.append(f'Expected {path} to be an object')
+            return x
+
+        return {k: value(v, f'{path}.{k}', errors) for k, v in x.items()}
+
+    return validate
+
+
+def _primitive(t: Type) -> Validator:
+    # JSON has no separate type for integral floats, and `bool` is
+    # a subclass of `int` in Python, so both cases are special.
+    accepted = (int, float) if t is float else t
+
+    def validate(x, path, errors):
+        if not isinstance(x, accepted) or \
+           (isinstance(x, bool) and t is not bool):
+            errors.append(f'Expected {path} to be of type {t.__name__}')
+
+        return x
+
+    return validate
+
+
+def _schema(t: Type) -> Validator:
+    hints = get_type_hints(t)
+    validators = {k: _compile(v) for k, v in hints.items()}
+    required = [k for k in hints if k not in _defaults(t)]
+
+    def validate(x, path, errors):
+        if not isinstance(x, dict):
+            errors.append(f'Expected {path} to be an object')
+            return x
+
+        count = len(errors)
+
+        for k in required:
+            if k not in x:
+                errors.append(f'Expected {path}.{k} to be present')
+
+        values = {k: validators[k](v, f'{path}.{k}', errors)
+                  for k, v in x.items() if k in validators}
+
+        return t(**values) if len(errors) == count else x
+
+    return validate
+
+
+def _defaults(t: Type) -> Dict[str, Any]:
+    if is_dataclass(t):
+        return {x.name: x.default for x in fields(t)
+                if x.default is not MISSING or
+                x.default_factory is not MISSING}
+
+    return dict(getattr(t, '_field_defaults', {}))
+
+
+def _is_schema(t: Any) -> bool:
+    return is_dataclass(t) or hasattr(t, '_fields')
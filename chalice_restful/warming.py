@@ -0,0 +1,30 @@
+from hmac import compare_digest
+from typing import Any, Dict, Optional
+
+
+def is_warm_up(event: Dict[str, Any], header: Optional[str],
+               secret: Optional[str] = None) -> bool:
+    """Whether the Lambda event is a warm-up ping.
+
+    Pings are either scheduled events of CloudWatch (EventBridge)
+    or API Gateway requests with the specified marker header whose
+    value is the shared secret. Anyone can send a header, so requests
+    without the secret aren't pings.
+
+    Args:
+        event: Event the Lambda is invoked with.
+        header: Name of the marker header, or `None` if pings
+            aren't sent through API Gateway.
+        secret: Expected value of the marker header.
+    """
+
+    if event.get('source') == 'aws.events' and \
+       event.get('detail-type') == 'Scheduled Event':
+        return True
+
+    if header is None or not secret:
+        return False
+
+    headers = event.get('headers') or {}
+    return any(compare_digest(str(v).encode(), secret.encode())
+               for k, v in headers.items() if k.lower() == header.lower())
@@ -10,6 +10,10 @@ setup(
     long_description=open('README.md').read(),
     long_description_content_type='text/markdown',
     install_requires=['chalice'],
+    extras_require={'orjson': ['orjson'], 'brotli': ['brotli']},
+    entry_points={
+        'console_scripts': ['chalice-restful=chalice_restful.__main__:main'],
+    },
     url='https://github.com/JoshuaLight/chalice-restful',
     author='Joshua Light',
     author_email='j.light.developer@gmail.com',
@@ -0,0 +1,177 @@
+"""Cold-start and registration benchmarks.
+
+Measures the overhead `chalice_restful` adds on top of bare `Chalice`:
+    a) import time of the package;
+    b) time of `Api.add` for 10, 100 and 1000 synthetic resources;
+    c) per-request dispatch time compared to a bare `Chalice.route`,
+       measured through the Chalice local gateway.
+
+Run from the root of the repository:
+    python -m tests.benchmarks.run
+
+Each run is appended to `.benchmarks/results.jsonl` together with the
+current commit, and compared with the previous run, so regressions can
+be tracked across commits.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from statistics import median
+from typing import Any, Callable, Dict, List, Optional
+
+from chalice import Chalice
+from chalice.config import Config
+from chalice.local import LocalGateway
+
+from chalice_restful import Api, Resource, cors
+
+IMPORT_SCRIPT = '''
+import time
+start = time.perf_counter()
+import chalice_restful
+print(time.perf_counter() - start)
+'''
+
+
+def measure(action: Callable, repeat: int,
+            setup: Callable[[], Any] = None) -> float:
+    """Returns the median time of the action in seconds.
+
+    If `setup` is given, it's called before every repeat (outside
+    of the measured time) and its result is passed to the action.
+    """
+
+    times = []
+
+    for _ in range(repeat):
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        action(*args)
+        times.append(time.perf_counter() - start)
+
+    return median(times)
+
+
+def import_time(repeat: int) -> float:
+    """Measures import time of `chalice_restful` in a fresh interpreter."""
+
+    times = []
+
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT])
+        times.append(float(output))
+
+    return median(times)
+
+
+def resources(count: int) -> List[type]:
+    """Creates synthetic resources with two endpoints each."""
+
+    def get(id): ...
+    def put(id): ...
+
+    return [type(f'Resource{i}', (Resource,), {
+        'route': f'/v1/resources{i}/{{id}}',
+        'get': cors(get),
+        'put': put,
+    }) for i in range(count)]
+
+
+def add_time(count: int, repeat: int) -> float:
+    """Measures time of adding synthetic resources to the `Api`.
+
+    Resources are created anew for every repeat, since validation
+    of a class is cached and would be skipped after the first one.
+    """
+
+    def add(classes: List[type]):
+        api = Api(Chalice('benchmark', configure_logs=False))
+        for x in classes:
+            api.add(x)
+
+    return measure(add, repeat, setup=lambda: resources(count))
+
+
+def dispatch_times(requests: int) -> Dict[str, float]:
+    """Measures per-request time of bare and `Api` endpoints."""
+
+    app = Chalice('benchmark', configure_logs=False)
+    api = Api(app)
+
+    @app.route('/bare/{id}', methods=['GET'])
+    def bare(id): return {'id': id}
+
+    class Wrapped(Resource):
+        route = '/wrapped/{id}'
+
+        def get(id): return {'id': id}
+
+    class Bound(Resource):
+        route = '/bound/{id}'
+
+        def get(self, id): return {'id': id}
+
+    api.add(Wrapped)
+    api.add(Bound)
+
+    gateway = LocalGateway(app, Config())
+    request = lambda x: lambda: gateway.handle_request('GET', x, {}, '')
+
+    return {f'dispatch_{x}': measure(request(f'/{x}/1'), requests)
+            for x in ('bare', 'wrapped', 'bound')}
+
+
+def commit() -> Optional[str]:
+    try:
+        output = subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+                                         stderr=subprocess.DEVNULL)
+        return output.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def previous(output: str) -> Optional[dict]:
+    if not os.path.exists(output):
+        return None
+
+    with open(output) as f:
+        lines = [x for x in f if x.strip()]
+
+    return json.loads(lines[-1]) if lines else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--output', default='.benchmarks/results.jsonl')
+    args = parser.parse_args()
+
+    results = {'import': import_time(args.repeat)}
+
+    for x in (10, 100, 1000):
+        results[f'add_{x}'] = add_time(x, args.repeat)
+
+    results.update(dispatch_times(args.requests))
+
+    last = previous(args.output)
+
+    for name, value in results.items():
+        line = f'{name:<20} {value * 1e6:>12.1f} us'
+        if last and name in last['results']:
+            change = value / last['results'][name] - 1
+            line += f' {change:>+8.1%}'
+        print(line)
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'a') as f:
+        entry = {'commit': commit(), 'time': time.time(), 'results': results}
+        f.write(json.dumps(entry) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+import json
+
+from chalice.app import Authorizer
+from mock import MagicMock
+
+from chalice_restful import Resource, api_key_required, authorizer, cors
+from chalice_restful.__main__ import main
+from chalice_restful.analysis import describe, openapi, problems
+from chalice_restful.endpoints import LazyEndpoint, resolve
+
+
+def endpoints(*resources):
+    return [x for r in resources for x in resolve(r, ['get', 'post'])]
+
+
+def test_that_endpoint_is_described_with_route_options():
+    # Arrange.
+    auth = MagicMock(spec=Authorizer)
+    auth.name = 'Cognito'
+
+    @cors
+    @authorizer(auth)
+    class Items(Resource):
+        route = '/items'
+
+        def get(): ...
+
+    # Act.
+    described = describe(endpoints(Items)[0])
+
+    # Assert.
+    assert described['path'] == '/items'
+    assert described['method'] == 'GET'
+    assert described['resource'].endswith('Items')
+    assert described['options'] == {'cors': True, 'authorizer': 'Cognito'}
+
+
+def test_that_duplicate_routes_are_found():
+    # Arrange.
+    class Items(Resource):
+        route = '/items'
+
+        def get(): ...
+
+    class OtherItems(Resource):
+        route = '/items'
+
+        def get(): ...
+        def post(): ...
+
+    # Act.
+    found = problems(endpoints(Items, OtherItems))
+
+    # Assert.
+    assert found == ['Duplicate route: GET /items is defined 2 times']
+
+
+def test_that_duplicate_lazy_routes_are_found():
+    # Arrange.
+    class Items(Resource):
+        route = '/items'
+
+        def get(): ...
+
+    lazy = LazyEndpoint('app.items:Items', '/items', 'GET', {})
+
+    # Act.
+    found = problems(endpoints(Items) + [lazy])
+
+    # Assert.
+    assert found == ['Duplicate route: GET /items is defined 2 times']
+
+
+def test_that_conflicting_path_parameters_are_found():
+    # Arrange.
+    class Item(Resource):
+        route = '/items/{id}'
+
+        def get(): ...
+
+    class ItemTags(Resource):
+        route = '/items/{name}/tags/{tag}'
+
+        def get(): ...
+
+    class Orders(Resource):
+        route = '/orders/{id}'
+
+        def get(): ...
+
+    # Act.
+    found = problems(endpoints(Item, ItemTags, Orders))
+
+    # Assert.
+    assert found == ['Conflicting path parameters: {id} in /items/{id} '
+                     'and {name} in /items/{name}/tags/{tag}']
+
+
+def test_that_openapi_describes_paths_parameters_and_security():
+    # Arrange.
+    @api_key_required
+    class Item(Resource):
+        route = '/items/{id}'
+
+        def get(): ...
+
+    # Act.
+    document = openapi(endpoints(Item), 'Items')
+
+    # Assert.
+    operation = document['paths']['/items/{id}']['get']
+    assert operation['parameters'][0]['name'] == 'id'
+    assert operation['security'] == [{'api_key': []}]
+    assert 'api_key' in document['components']['securitySchemes']
+
+
+def test_that_cli_exports_package(capsys):
+    # Act.
+    code = main(['export', 'tests.unit.fixtures.resources'])
+
+    # Assert.
+    exported = json.loads(capsys.readouterr().out)
+    assert code == 0
+    assert {(x['method'], x['path']) for x in exported} >= \
+        {('GET', '/items'), ('GET', '/orders')}
+
+
+def test_that_cli_exports_lazy_endpoints_of_api(capsys):
+    # Act.
+    code = main(['export', 'tests.unit.fixtures.lazy:api'])
+
+    # Assert.
+    exported = json.loads(capsys.readouterr().out)
+    assert code == 0
+    assert {'resource': 'tests.unit.fixtures.aliased:Aliased',
+            'path': '/orders/{id}', 'method': 'GET',
+            'options': {}} in exported
@@ -1,7 +1,13 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+
 import pytest
+from chalice.app import MethodNotAllowedError
 from mock import MagicMock
 
 from chalice_restful import Api, Resource, authorizer, cors, api_key_required
+from chalice_restful.common.guards import Validation
 
 
 def test_that_cant_add_resource_class_itself():
@@ -168,3 +174,256 @@ def test_that_request_returns_chalice_current_request():
 
     # Assert.
     assert request == 'Fake'
+
+
+class LazyResource(Resource):
+    route = '/lazy'
+
+    def get(): return 'Lazy'
+
+
+def test_that_lazy_resource_is_added_to_chalice_with_stub_endpoints():
+    # Arrange.
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+
+    # Act.
+    api.add_lazy('/lazy', 'tests.unit.missing:Missing', methods=['get'])
+
+    # Assert.
+    app.route.assert_called_with('/lazy', methods=['GET'])
+    assert route.call_args[0][0].__name__ == 'get'
+
+
+def test_that_lazy_resource_is_imported_on_first_request():
+    # Arrange.
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+    api.add_lazy('/lazy', 'tests.unit.api_test:LazyResource', methods=['get'])
+    stub = route.call_args[0][0]
+
+    # Act.
+    response = stub()
+
+    # Assert.
+    assert response == 'Lazy'
+
+
+def test_that_lazy_resource_without_requested_method_is_not_allowed():
+    # Arrange.
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+    api.add_lazy('/lazy', 'tests.unit.api_test:LazyResource')
+    stub = route.call_args[0][0]
+
+    # Act.
+    call = lambda: stub()
+
+    # Assert.
+    with pytest.raises(MethodNotAllowedError):
+        call()
+
+
+def test_that_lazy_resource_route_should_match_path():
+    # Arrange.
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+    api.add_lazy('/other', 'tests.unit.api_test:LazyResource', methods=['get'])
+    stub = route.call_args[0][0]
+
+    # Act.
+    call = lambda: stub()
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        call()
+
+
+def test_that_lazy_resource_route_options_should_match_registered(
+        create_api):
+    # Arrange.
+    api, _, route = create_api()
+    api.add_lazy('/authorized', 'tests.unit.fixtures.authorized:Authorized',
+                 methods=['get'])
+    stub = route.call_args[0][0]
+
+    # Act.
+    call = lambda: stub()
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        call()
+
+
+def test_that_cant_add_lazy_resource_with_invalid_target():
+    # Arrange.
+    api = Api(MagicMock())
+
+    # Act.
+    add = lambda: api.add_lazy('/lazy', 'tests.unit.api_test.LazyResource')
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        add()
+
+
+def test_that_endpoint_accepting_self_is_called_on_resource_instance():
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def setup(self):
+            self.value = 'Setup'
+
+        def get(self): return self.value
+
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response == 'Setup'
+
+
+def test_that_resource_instance_is_created_once():
+    # Arrange.
+    instances = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        def setup(self):
+            instances.append(self)
+
+        def get(self): ...
+        def post(self): ...
+
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+    api.add(SimpleResource)
+    handlers = [x[0][0] for x in route.call_args_list]
+
+    # Act.
+    for x in handlers + handlers:
+        x()
+
+    # Assert.
+    assert len(instances) == 1
+    assert api.instance(SimpleResource) is instances[0]
+
+
+def test_that_coroutine_endpoint_is_run_to_completion():
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        async def get(id):
+            await asyncio.sleep(0)
+            return id
+
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    response = handler(id='1')
+
+    # Assert.
+    assert response == '1'
+
+
+def test_that_coroutine_endpoints_share_event_loop():
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        async def get(self): return asyncio.get_running_loop()
+
+    app = MagicMock()
+    route = MagicMock()
+    app.route = MagicMock(return_value=route)
+    api = Api(app)
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    loops = [handler(), handler()]
+
+    # Assert.
+    assert loops[0] is loops[1]
+
+
+def test_that_all_failures_of_resource_are_reported():
+    # Arrange.
+    class Invalid(Resource): ...
+    api = Api(MagicMock())
+
+    # Act.
+    add = lambda: api.add(Invalid)
+
+    # Assert.
+    with pytest.raises(AssertionError, match='route attribute; .* at least'):
+        add()
+
+
+def test_that_resource_is_validated_once(monkeypatch):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): ...
+
+    validations = []
+    monkeypatch.setattr('chalice_restful.core.Validation',
+                        lambda: validations.append(1) or Validation())
+
+    # Act.
+    Api(MagicMock()).add(SimpleResource)
+    Api(MagicMock()).add(SimpleResource)
+
+    # Assert.
+    assert len(validations) == 1
+
+
+def test_that_concurrent_first_requests_create_one_instance():
+    # Arrange.
+    created = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        def setup(self):
+            created.append(self)
+            sleep(0.05)
+
+        def get(self): ...
+
+    api = Api(MagicMock())
+
+    # Act.
+    with ThreadPoolExecutor(4) as executor:
+        instances = list(executor.map(lambda _: api.instance(SimpleResource),
+                                      range(4)))
+
+    # Assert.
+    assert len(created) == 1
+    assert all(x is created[0] for x in instances)
@@ -0,0 +1,139 @@
+import time
+
+import pytest
+from chalice.app import UnauthorizedError
+
+from chalice_restful import Jwks, Resource, token_authorizer
+
+
+def test_that_token_is_verified_once_and_principal_is_cached(create_handler):
+    # Arrange.
+    tokens = []
+
+    def verify(token):
+        tokens.append(token)
+        return {'sub': 'user'}
+
+    @token_authorizer(verify)
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return 'Body'
+
+    handler, app = create_handler(SimpleResource,
+                                  {'headers': {'Authorization': 'Bearer x'}})
+
+    # Act.
+    responses = [handler(), handler()]
+
+    # Assert.
+    assert responses == ['Body', 'Body']
+    assert tokens == ['x']
+    assert app.current_request.context['authorizer'] == {'sub': 'user'}
+
+
+def test_that_invalid_token_is_unauthorized(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @token_authorizer(lambda _: None)
+        def get(): ...
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'Authorization': 'x'}})
+
+    # Act.
+    call = lambda: handler()
+
+    # Assert.
+    with pytest.raises(UnauthorizedError):
+        call()
+
+
+def test_that_missing_token_is_unauthorized(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @token_authorizer(lambda _: {})
+        def get(): ...
+
+    handler, _ = create_handler(SimpleResource, {'headers': {}})
+
+    # Act.
+    call = lambda: handler()
+
+    # Assert.
+    with pytest.raises(UnauthorizedError):
+        call()
+
+
+def test_that_expired_principal_is_not_cached(create_handler):
+    # Arrange.
+    tokens = []
+
+    def verify(token):
+        tokens.append(token)
+        return {'exp': time.time() - 1}
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @token_authorizer(verify)
+        def get(): ...
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'Authorization': 'x'}})
+
+    # Act.
+    handler()
+    handler()
+
+    # Assert.
+    assert tokens == ['x', 'x']
+
+
+def test_that_jwks_are_fetched_once_and_parsed():
+    # Arrange.
+    fetches = []
+
+    def fetch(url):
+        fetches.append(url)
+        return {'keys': [{'kid': 'a', 'n': '1'}]}
+
+    jwks = Jwks('url', parse=lambda x: f'Parsed {x}', fetch=fetch)
+
+    # Act.
+    keys = [jwks.key('a'), jwks.key('a')]
+
+    # Assert.
+    assert keys[0] == keys[1] == 'Parsed {"kid": "a", "n": "1"}'
+    assert fetches == ['url']
+
+
+def test_that_jwks_unknown_key_is_refetched_at_most_once_per_interval():
+    # Arrange.
+    now = [0]
+    fetches = []
+
+    def fetch(url):
+        fetches.append(url)
+        return {'keys': [{'kid': 'a'}]}
+
+    jwks = Jwks('url', fetch=fetch, min_refresh=60, clock=lambda: now[0])
+    jwks.key('a')
+
+    # Act.
+    now[0] = 30
+    early = lambda: jwks.key('b')
+
+    # Assert.
+    with pytest.raises(UnauthorizedError):
+        early()
+    assert len(fetches) == 1
+
+    now[0] = 60
+    with pytest.raises(UnauthorizedError):
+        jwks.key('b')
+    assert len(fetches) == 2
@@ -0,0 +1,138 @@
+import json
+
+from chalice import Chalice
+from chalice.app import NotFoundError
+from chalice.config import Config
+from chalice.local import LocalGateway
+
+from chalice_restful import (Api, Resource, api_key_required, encode_json,
+                             idempotent)
+
+
+def create_gateway(max_workers=1, json_encoder=None):
+    app = Chalice('test', configure_logs=False)
+    api = Api(app, json_encoder=json_encoder)
+
+    class Items(Resource):
+        route = '/items'
+
+        def get(): return {'query': api.request.query_params.get('q')}
+
+        @idempotent()
+        def post(): return api.request.json_body
+
+    class Item(Resource):
+        route = '/items/{id}'
+
+        def get(id):
+            if id == '0':
+                raise NotFoundError('Missing')
+            return {'id': id, 'header': api.request.headers.get('x-test')}
+
+    @api_key_required
+    class Secret(Resource):
+        route = '/secret'
+
+        def get(): ...
+
+    api.add(Items)
+    api.add(Item)
+    api.add(Secret)
+    api.add_batch(max_workers=max_workers)
+
+    return LocalGateway(app, Config())
+
+
+def request_batch(gateway, requests, headers=None):
+    response = gateway.handle_request(
+        'POST', '/batch',
+        {'content-type': 'application/json', 'x-test': 'outer',
+         **(headers or {})},
+        json.dumps(requests))
+
+    return json.loads(response['body'])
+
+
+def test_that_batch_dispatches_every_sub_request():
+    # Arrange.
+    gateway = create_gateway()
+
+    # Act.
+    results = request_batch(gateway, [
+        {'method': 'GET', 'path': '/items?q=x'},
+        {'method': 'GET', 'path': '/items/1'},
+        {'method': 'POST', 'path': '/items', 'body': {'a': 1}},
+    ])
+
+    # Assert.
+    assert [x['status'] for x in results] == [200, 200, 200]
+    assert [x['body'] for x in results] == [
+        {'query': 'x'}, {'id': '1', 'header': 'outer'}, {'a': 1}]
+
+
+def test_that_batch_reports_errors_of_sub_requests():
+    # Arrange.
+    gateway = create_gateway()
+
+    # Act.
+    results = request_batch(gateway, [
+        {'method': 'GET', 'path': '/items/0'},
+        {'method': 'GET', 'path': '/missing'},
+        {'method': 'PUT', 'path': '/items'},
+        {'method': 'GET', 'path': '/secret'},
+    ])
+
+    # Assert.
+    assert [x['status'] for x in results] == [404, 404, 405, 403]
+
+
+def test_that_batch_dispatches_sub_requests_concurrently():
+    # Arrange.
+    gateway = create_gateway(max_workers=4)
+    requests = [{'path': f'/items/{x}'} for x in range(1, 9)]
+
+    # Act.
+    results = request_batch(gateway, requests)
+
+    # Assert.
+    assert [x['body']['id'] for x in results] == \
+        [str(x) for x in range(1, 9)]
+
+
+def test_that_batch_rejects_too_many_sub_requests():
+    # Arrange.
+    gateway = create_gateway()
+
+    # Act.
+    results = request_batch(gateway, [{'path': '/items'}] * 26)
+
+    # Assert.
+    assert results['Code'] == 'BadRequestError'
+
+
+def test_that_bodies_serialized_by_json_encoder_arent_encoded_twice():
+    # Arrange.
+    gateway = create_gateway(json_encoder=encode_json)
+
+    # Act.
+    results = request_batch(gateway, [
+        {'method': 'POST', 'path': '/items', 'body': {'a': 1}},
+    ])
+
+    # Assert.
+    assert results[0]['body'] == {'a': 1}
+
+
+def test_that_sub_requests_dont_inherit_idempotency_key():
+    # Arrange.
+    gateway = create_gateway()
+
+    # Act.
+    results = request_batch(gateway, [
+        {'method': 'POST', 'path': '/items', 'body': {'a': 1}},
+        {'method': 'POST', 'path': '/items', 'body': {'a': 2}},
+    ], headers={'idempotency-key': 'batch'})
+
+    # Assert.
+    assert [x['status'] for x in results] == [200, 200]
+    assert [x['body'] for x in results] == [{'a': 1}, {'a': 2}]
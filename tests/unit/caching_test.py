@@ -0,0 +1,155 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from chalice_restful import Resource, cached
+from chalice_restful.caching import LruCache
+
+
+def test_that_cached_config_cant_have_unknown_vary_on():
+    # Arrange.
+    def fake(): ...
+
+    # Act.
+    decorate = lambda: cached(vary_on=['body'])(fake)
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        decorate()
+
+
+def test_that_cached_endpoint_is_called_once_for_same_request(create_handler):
+    # Arrange.
+    calls = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @cached(ttl=30)
+        def get():
+            calls.append(1)
+            return 'Response'
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Act.
+    responses = [handler(), handler()]
+
+    # Assert.
+    assert responses == ['Response', 'Response']
+    assert len(calls) == 1
+
+
+def test_that_cached_endpoint_varies_on_path_parameters(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        @cached()
+        def get(id): return id
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Act.
+    responses = [handler(id='1'), handler(id='2')]
+
+    # Assert.
+    assert responses == ['1', '2']
+
+
+def test_that_cached_endpoint_varies_on_headers(create_api):
+    # Arrange.
+    @cached(vary_on=['headers:Accept'])
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return api.request.headers['Accept']
+
+    api, app, route = create_api()
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    app.current_request.headers = {'Accept': 'a'}
+    first = handler()
+    app.current_request.headers = {'Accept': 'b'}
+    second = handler()
+
+    # Assert.
+    assert (first, second) == ('a', 'b')
+
+
+def test_that_cached_resource_doesnt_cache_not_get_endpoints(create_api):
+    # Arrange.
+    @cached()
+    class SimpleResource(Resource):
+        route = '/'
+
+        def post(): ...
+
+    api, _, route = create_api()
+
+    # Act.
+    api.add(SimpleResource)
+
+    # Assert.
+    route.assert_called_with(SimpleResource.post)
+
+
+def test_that_lru_cache_evicts_least_recently_used_entry():
+    # Arrange.
+    cache = LruCache(max_entries=2, ttl=10)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+
+    # Act.
+    cache.put('c', 3)
+
+    # Assert.
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_that_lru_cache_doesnt_return_expired_entry():
+    # Arrange.
+    now = [0]
+    cache = LruCache(max_entries=2, ttl=10, clock=lambda: now[0])
+    cache.put('a', 1)
+
+    # Act.
+    now[0] = 10
+
+    # Assert.
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_that_lru_cache_is_safe_to_use_from_many_threads():
+    # Arrange.
+    cache = LruCache(max_entries=8, ttl=60)
+
+    def work(i):
+        for x in range(2000):
+            cache.put((i, x % 16), x)
+            cache.get((i, (x + 1) % 16))
+
+    # Act.
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(work, range(8)))
+
+    # Assert.
+    assert len(cache) == 8
+
+
+def test_that_lru_cache_adds_only_absent_keys():
+    # Arrange.
+    cache = LruCache(max_entries=8, ttl=60)
+
+    # Act.
+    added = [cache.add('a', 1), cache.add('a', 2)]
+
+    # Assert.
+    assert added == [True, False]
+    assert cache.get('a') == 1
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import sleep
+
+import pytest
+
+from mock import MagicMock
+
+from chalice_restful import Resource, coalesce
+
+
+def call_concurrently(handler, started, release, kwargs):
+    with ThreadPoolExecutor(len(kwargs)) as executor:
+        futures = [executor.submit(handler, **kwargs[0])]
+        started.wait(1)
+        futures += [executor.submit(handler, **x) for x in kwargs[1:]]
+
+        # Lets the rest of the requests reach the ongoing call.
+        sleep(0.1)
+        release.set()
+        return [x.result(1) for x in futures]
+
+
+def test_that_identical_concurrent_requests_share_a_call(create_handler):
+    # Arrange.
+    calls = []
+    started, release = Event(), Event()
+
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        @coalesce()
+        def get(id):
+            calls.append(id)
+            started.set()
+            release.wait(1)
+            return id
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Act.
+    responses = call_concurrently(handler, started, release,
+                                  [{'id': '1'}] * 4)
+
+    # Assert.
+    assert responses == ['1'] * 4
+    assert calls == ['1']
+
+
+def test_that_sequential_requests_arent_coalesced(create_handler):
+    # Arrange.
+    calls = []
+
+    @coalesce()
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get():
+            calls.append(1)
+            return 'Response'
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Act.
+    handler(), handler()
+
+    # Assert.
+    assert len(calls) == 2
+
+
+def test_that_error_is_raised_for_every_coalesced_request(create_handler):
+    # Arrange.
+    started, release = Event(), Event()
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @coalesce()
+        def get():
+            started.set()
+            release.wait(1)
+            raise ValueError('Error')
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Assert.
+    with pytest.raises(ValueError):
+        call_concurrently(handler, started, release, [{}, {}])
+
+
+def test_that_requests_of_different_clients_arent_identical():
+    # Arrange.
+    def fake(): ...
+
+    coalescing = coalesce()(fake).coalesce
+    requests = [MagicMock(query_params=None, headers=headers,
+                          context={'authorizer': authorizer})
+                for headers, authorizer in [({}, {'sub': 'alice'}),
+                                            ({}, {'sub': 'bob'}),
+                                            ({'Authorization': 'a'}, None),
+                                            ({'Authorization': 'b'}, None),
+                                            ({'x-api-key': 'a'}, None)]]
+
+    # Act.
+    keys = {coalescing.key(x, {'id': '1'}) for x in requests}
+
+    # Assert.
+    assert len(keys) == len(requests)
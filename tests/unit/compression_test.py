@@ -0,0 +1,93 @@
+import gzip
+import json
+
+import pytest
+from chalice.app import Response
+
+from chalice_restful import Resource, compress
+
+
+def test_that_compress_cant_have_unknown_algorithm():
+    # Arrange.
+    def fake(): ...
+
+    # Act.
+    decorate = lambda: compress(algorithms=['zip'])(fake)
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        decorate()
+
+
+def test_that_large_response_is_compressed_by_accepted_algorithm(create_handler):
+    # Arrange.
+    @compress(min_bytes=10, algorithms=['deflate', 'gzip'])
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return {'items': ['x'] * 100}
+
+    handler, _ = create_handler(
+        SimpleResource, {'headers': {'accept-encoding': 'gzip, deflate;q=0'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.body)) == \
+        {'items': ['x'] * 100}
+
+
+def test_that_small_response_is_not_compressed(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @compress(min_bytes=1024)
+        def get(): return {'a': 1}
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'accept-encoding': 'gzip'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response.body == {'a': 1}
+
+
+def test_that_response_is_not_compressed_if_not_accepted(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @compress(min_bytes=1)
+        def get(): return 'Text'
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'accept-encoding': 'identity'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response == 'Text'
+
+
+def test_that_response_of_not_binary_type_is_not_compressed(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @compress(min_bytes=1)
+        def get(): return Response('x' * 100, {'content-type': 'text/csv'})
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'accept-encoding': 'gzip'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert 'Content-Encoding' not in response.headers
@@ -0,0 +1,126 @@
+from datetime import datetime
+
+from chalice.app import Response
+
+from chalice_restful import Resource
+
+
+def test_that_matching_etag_returns_not_modified_without_calling_get(create_handler):
+    # Arrange.
+    calls = []
+
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        def etag(id): return f'v{id}'
+
+        def get(id):
+            calls.append(id)
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'if-none-match': 'W/"v1"'}})
+
+    # Act.
+    response = handler(id='1')
+
+    # Assert.
+    assert response.status_code == 304
+    assert response.headers['ETag'] == '"v1"'
+    assert calls == []
+
+
+def test_that_not_matching_etag_calls_get_and_adds_etag_header(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def etag(self): return 'v2'
+        def get(self): return Response(body='Body', headers={'X': 'y'})
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'if-none-match': '"v1"'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response.status_code == 200
+    assert response.headers == {'ETag': '"v2"', 'X': 'y'}
+
+
+def test_that_not_modified_since_returns_not_modified(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def last_modified(): return datetime(2020, 1, 1, 12, 0, 0)
+        def get(): ...
+
+    handler, _ = create_handler(SimpleResource, {'headers': {
+        'if-modified-since': 'Wed, 01 Jan 2020 12:00:00 GMT'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response.status_code == 304
+    assert response.headers['Last-Modified'] == \
+        'Wed, 01 Jan 2020 12:00:00 GMT'
+
+
+def test_that_modified_since_calls_get(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def last_modified(): return datetime(2020, 1, 2)
+        def get(): return 'Body'
+
+    handler, _ = create_handler(SimpleResource, {'headers': {
+        'if-modified-since': 'Wed, 01 Jan 2020 12:00:00 GMT'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert (response.status_code, response.body) == (200, 'Body')
+
+
+def test_that_etag_of_any_type_is_quoted(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def etag(): return 3
+        def get(): return 'Body'
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'if-none-match': '"3"'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response.status_code == 304
+    assert response.headers['ETag'] == '"3"'
+
+
+def test_that_missing_validators_add_no_headers(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def etag(): return None
+        def last_modified(): return None
+        def get(): return 'Body'
+
+    handler, _ = create_handler(SimpleResource,
+                                {'headers': {'if-none-match': '*'}})
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+    assert 'Last-Modified' not in response.headers
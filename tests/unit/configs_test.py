@@ -1,6 +1,8 @@
 import pytest
+from mock import MagicMock
 
-from chalice_restful import config, flag, only_classes, only_functions
+from chalice_restful import (Api, Resource, config, configs, flag, only_classes,
+                             only_functions)
 
 
 def test_that_config_adds_named_field_to_the_class():
@@ -169,3 +171,107 @@ def test_that_multiple_flags_cant_override_each_other():
     # Assert.
     assert func.a
     assert func.b
+
+
+def test_that_config_adds_returned_value_when_decorator_returns_it():
+    # Arrange.
+    @config
+    def aspect(lower, upper=None):
+        return (lower, upper)
+    def fake(): ...
+
+    # Act.
+    fake = aspect(0, upper=100)(fake)
+
+    # Assert.
+    assert fake.aspect == (0, 100)
+
+
+def test_that_configs_are_stored_in_single_dictionary():
+    # Arrange.
+    @config
+    def aspect(_): ...
+
+    @flag
+    def has_x(): ...
+
+    # Act.
+    @aspect('value')
+    @has_x
+    def fake(): ...
+
+    # Assert.
+    assert configs.options(fake) == {'has_x': True, 'aspect': 'value'}
+
+
+def test_that_configs_of_subclass_dont_affect_base_class():
+    # Arrange.
+    @flag
+    def a(): ...
+
+    @flag
+    def b(): ...
+
+    @a
+    class Base: ...
+
+    # Act.
+    @b
+    class Derived(Base): ...
+
+    # Assert.
+    assert configs.options(Base) == {'a': True}
+    assert configs.options(Derived) == {'a': True, 'b': True}
+
+
+def test_that_configs_of_all_base_classes_are_kept_by_decorated_class():
+    # Arrange.
+    @flag
+    def a(): ...
+
+    @flag
+    def b(): ...
+
+    @config
+    def c(_): ...
+
+    @a
+    class Mixin: ...
+
+    class Base:
+        b = True
+
+    # Act.
+    @c('value')
+    class Derived(Mixin, Base): ...
+
+    # Assert.
+    assert configs.options(Derived) == {'a': True, 'b': True, 'c': 'value'}
+
+
+def test_that_constraints_arent_enforced_when_not_strict(monkeypatch):
+    # Arrange.
+    @flag
+    @only_classes
+    def has_x(): ...
+    def fake(): ...
+
+    monkeypatch.setattr(configs, 'strict', False)
+
+    # Act.
+    fake = has_x(fake)
+
+    # Assert.
+    assert fake.has_x
+
+
+def test_that_resources_arent_validated_when_not_strict():
+    # Arrange.
+    class Invalid(Resource): ...
+    api = Api(MagicMock(), strict=False)
+
+    # Act.
+    api.add(Invalid)
+
+    # Assert.
+    assert api.endpoints == []
@@ -0,0 +1,52 @@
+import pytest
+from mock import MagicMock
+
+from chalice_restful import Api
+
+
+@pytest.fixture
+def create_api():
+    """Returns a factory of `Api` instances of a mocked `Chalice` app.
+
+    The factory accepts attributes of the current request (which has
+    no query parameters, headers and context by default) and options
+    of the `Api`, and returns the `Api`, the app and the route decorator,
+    whose last call receives the handler of the last added endpoint:
+        api, app, route = create_api({'headers': {}}, json_encoder=encode)
+        api.add(SimpleResource)
+        handler = route.call_args[0][0]
+    """
+
+    def create(request=None, **options):
+        app = MagicMock()
+        route = MagicMock()
+        app.route = MagicMock(return_value=route)
+        app.api.binary_types = ['application/json']
+        app.lambda_context = None
+
+        request = {'query_params': None, 'headers': {}, 'context': {},
+                   **(request or {})}
+        for k, v in request.items():
+            setattr(app.current_request, k, v)
+
+        return Api(app, **options), app, route
+
+    return create
+
+
+@pytest.fixture
+def create_handler(create_api):
+    """Returns a factory of handlers of resources.
+
+    Works like `create_api`, but adds the resource and returns the handler
+    of its last endpoint and the app:
+        handler, app = create_handler(SimpleResource, {'headers': {}})
+    """
+
+    def create(resource, request=None, **options):
+        api, app, route = create_api(request, **options)
+        api.add(resource)
+
+        return route.call_args[0][0], app
+
+    return create
@@ -0,0 +1,95 @@
+import pytest
+
+from tests.unit.fixtures.aliased import Aliased
+from tests.unit.fixtures.authorized import Authorized
+
+
+def test_that_add_all_adds_every_resource_with_route_in_package(create_api):
+    # Arrange.
+    api, _, _ = create_api()
+
+    # Act.
+    api.add_all('tests.unit.fixtures.resources')
+
+    # Assert.
+    assert sorted((x.path, x.method) for x in api.endpoints) == \
+        [('/items', 'GET'), ('/items', 'POST'), ('/orders', 'GET')]
+
+
+def test_that_add_all_reports_every_invalid_resource(create_api):
+    # Arrange.
+    api, app, _ = create_api()
+
+    # Act.
+    add = lambda: api.add_all('tests.unit.fixtures.invalid')
+
+    # Assert.
+    with pytest.raises(AssertionError) as e:
+        add()
+    assert 'NoEndpoints' in str(e.value)
+    assert 'AlsoNoEndpoints' in str(e.value)
+    app.route.assert_not_called()
+
+
+def test_that_manifest_resources_are_added_lazily(tmpdir, create_api):
+    # Arrange.
+    file = str(tmpdir.join('manifest.json'))
+    api, _, _ = create_api()
+    api.add_all('tests.unit.fixtures.resources')
+    api.save_manifest(file)
+    api, app, route = create_api()
+
+    # Act.
+    api.add_manifest(file)
+
+    # Assert.
+    app.route.assert_any_call('/items', methods=['POST'], cors=True)
+    app.route.assert_any_call('/orders', methods=['GET'])
+    assert api.endpoints == []
+
+
+def test_that_manifest_stub_endpoint_calls_resource(tmpdir, create_api):
+    # Arrange.
+    file = str(tmpdir.join('manifest.json'))
+    api, _, _ = create_api()
+    api.add_all('tests.unit.fixtures.resources')
+    api.save_manifest(file)
+    api, _, route = create_api()
+    api.add_manifest(file)
+    stubs = [x[0][0] for x in route.call_args_list]
+
+    # Act.
+    responses = [x() for x in stubs if x.__name__ == 'get']
+
+    # Assert.
+    assert sorted(responses) == ['Items', 'Orders']
+
+
+def test_that_manifest_keeps_method_of_aliased_endpoint(tmpdir, create_api):
+    # Arrange.
+    file = str(tmpdir.join('manifest.json'))
+    api, _, _ = create_api()
+    api.add(Aliased)
+    api.save_manifest(file)
+    api, app, route = create_api()
+
+    # Act.
+    api.add_manifest(file)
+    stub = route.call_args[0][0]
+
+    # Assert.
+    app.route.assert_called_once_with('/aliased', methods=['GET'])
+    assert stub() == 'Aliased'
+
+
+def test_that_cant_save_manifest_with_not_serializable_options(tmpdir, create_api):
+    # Arrange.
+    api, _, _ = create_api()
+    api.add(Authorized)
+
+    # Act.
+    save = lambda: api.save_manifest(str(tmpdir.join('manifest.json')))
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        save()
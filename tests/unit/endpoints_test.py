@@ -0,0 +1,163 @@
+from functools import wraps
+
+import pytest
+from mock import MagicMock
+
+from chalice_restful import (Api, Resource, api_key_required, authorizer,
+                             config, cors, flag, route_option)
+from chalice_restful.endpoints import resolve
+
+
+def test_that_endpoint_options_are_merged_with_resource_options():
+    # Arrange.
+    @cors
+    @authorizer('x')
+    class SimpleResource(Resource):
+        route = '/'
+
+        @authorizer('y')
+        def get(): ...
+
+    # Act.
+    endpoints = resolve(SimpleResource, ['get'])
+
+    # Assert.
+    assert endpoints[0].options['cors']
+    assert endpoints[0].options['authorizer'] == 'y'
+
+
+def test_that_resolve_skips_missing_handlers():
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): ...
+
+    # Act.
+    endpoints = resolve(SimpleResource, ['get', 'post'])
+
+    # Assert.
+    assert [x.method for x in endpoints] == ['GET']
+
+
+def test_that_endpoint_options_cant_be_modified():
+    # Arrange.
+    @cors
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): ...
+
+    endpoint = resolve(SimpleResource, ['get'])[0]
+
+    # Act.
+    modify = lambda: endpoint.options.update(cors=False)
+
+    # Assert.
+    with pytest.raises(AttributeError):
+        modify()
+
+
+def test_that_custom_route_option_is_passed_to_chalice():
+    # Arrange.
+    @config
+    @route_option
+    def content_types(_): ...
+
+    @flag
+    def unrelated(): ...
+
+    @unrelated
+    @content_types(['text/plain'])
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): ...
+
+    app = MagicMock()
+    api = Api(app)
+
+    # Act.
+    api.add(SimpleResource)
+
+    # Assert.
+    app.route.assert_called_with('/', methods=['GET'],
+                                 content_types=['text/plain'])
+
+
+def test_that_added_endpoints_can_be_inspected():
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): ...
+        def post(): ...
+
+    api = Api(MagicMock())
+
+    # Act.
+    api.add(SimpleResource)
+
+    # Assert.
+    assert [(x.path, x.method) for x in api.endpoints] == \
+        [('/', 'GET'), ('/', 'POST')]
+
+
+def test_that_options_of_all_base_classes_are_merged():
+    # Arrange.
+    @cors
+    class A: ...
+
+    @api_key_required
+    class B: ...
+
+    class Items(A, B, Resource):
+        route = '/items'
+
+        def get(): ...
+
+    # Act.
+    endpoints = resolve(Items, ['get'])
+
+    # Assert.
+    assert dict(endpoints[0].route_options) == {'cors': True,
+                                                'api_key_required': True}
+
+
+def test_that_options_assigned_as_attributes_are_resolved():
+    # Arrange.
+    class Items(Resource):
+        route = '/items'
+        cors = True
+
+        def get(): ...
+
+    # Act.
+    endpoints = resolve(Items, ['get'])
+
+    # Assert.
+    assert endpoints[0].route_options['cors'] is True
+
+
+def test_that_parameters_of_wrapped_endpoints_are_resolved():
+    # Arrange.
+    def log(function):
+        @wraps(function)
+        def body(*args, **kwargs): return function(*args, **kwargs)
+
+        return body
+
+    class Items(Resource):
+        route = '/items/{id}'
+
+        def get(self, id, *, client, **kwargs): ...
+
+        @log
+        def put(id, client): ...
+
+    # Act.
+    endpoints = resolve(Items, ['get', 'put'])
+
+    # Assert.
+    assert [x.parameters for x in endpoints] == \
+        [('self', 'id', 'client'), ('id', 'client')]
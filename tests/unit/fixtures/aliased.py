@@ -0,0 +1,8 @@
+from chalice_restful import Resource, route
+
+
+@route('/aliased')
+class Aliased(Resource):
+    def fetch(): return 'Aliased'
+
+    get = fetch
@@ -0,0 +1,7 @@
+from chalice_restful import Resource, authorizer, route
+
+
+@route('/authorized')
+@authorizer(object())
+class Authorized(Resource):
+    def get(): ...
@@ -0,0 +1,9 @@
+from chalice_restful import Resource
+
+
+class NoEndpoints(Resource):
+    route = '/no-endpoints'
+
+
+class AlsoNoEndpoints(Resource):
+    route = '/also-no-endpoints'
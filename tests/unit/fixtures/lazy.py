@@ -0,0 +1,8 @@
+from chalice import Chalice
+
+from chalice_restful import Api
+
+api = Api(Chalice('lazy'))
+api.add_all('tests.unit.fixtures.resources')
+api.add_lazy('/orders/{id}', 'tests.unit.fixtures.aliased:Aliased',
+             methods=['get'])
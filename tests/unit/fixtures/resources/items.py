@@ -0,0 +1,12 @@
+from chalice_restful import Resource, cors, route
+
+
+class Base(Resource):
+    def get(): ...
+
+
+@route('/items')
+@cors
+class Items(Resource):
+    def get(): return 'Items'
+    def post(): ...
@@ -0,0 +1,7 @@
+from chalice_restful import Resource, route
+from tests.unit.fixtures.resources.items import Items  # noqa: F401
+
+
+@route('/orders')
+class Orders(Resource):
+    def get(): return 'Orders'
@@ -0,0 +1,44 @@
+import pytest
+
+from chalice_restful.common.guards import Validation, ensure
+
+
+def test_that_ensure_raises_on_first_failure():
+    # Act.
+    check = lambda: ensure(2 + 2).is_(5)
+
+    # Assert.
+    with pytest.raises(AssertionError, match='Expected 4 to be 5'):
+        check()
+
+
+def test_that_validation_collects_all_failures():
+    # Arrange.
+    validation = Validation()
+
+    # Act.
+    validation.ensure(2 + 2).is_(5)
+    validation.ensure(2 + 2).is_(4)
+    validation.ensure('path').starts_with('/')
+
+    # Assert.
+    assert validation.failures == ['Expected 4 to be 5',
+                                   'Expected path to start with /']
+    with pytest.raises(AssertionError, match='5; Expected path'):
+        validation.check()
+
+
+def test_that_message_is_formatted_only_on_failure():
+    # Arrange.
+    class Target:
+        formatted = 0
+
+        def __str__(self):
+            Target.formatted += 1
+            return 'Target'
+
+    # Act.
+    ensure(Target()).has_attribute('formatted')
+
+    # Assert.
+    assert Target.formatted == 0
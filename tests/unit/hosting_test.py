@@ -0,0 +1,111 @@
+import asyncio
+import io
+import json
+from wsgiref.util import setup_testing_defaults
+
+from chalice.app import NotFoundError
+from mock import MagicMock
+
+from chalice_restful import Api, Resource
+
+
+def create_api():
+    api = Api(MagicMock())
+
+    class Item(Resource):
+        route = '/items/{id}'
+
+        def get(id):
+            if id == '0':
+                raise NotFoundError('Missing')
+            return {'id': id, 'q': api.request.query_params['q']}
+
+        def put(id): return api.request.json_body
+
+    class Client(Resource):
+        route = '/client'
+
+        def get(): return api.request.context['identity']
+
+    api.add(Client)
+
+    api.add(Item)
+    return api
+
+
+def call_wsgi(application, method, path, query='', body=b''):
+    environ = {'REQUEST_METHOD': method, 'PATH_INFO': path,
+               'QUERY_STRING': query, 'CONTENT_TYPE': 'application/json',
+               'CONTENT_LENGTH': str(len(body)), 'REMOTE_ADDR': '127.0.0.1',
+               'wsgi.input': io.BytesIO(body)}
+    setup_testing_defaults(environ)
+    started = []
+
+    chunks = application(environ, lambda *x: started.append(x))
+    return started[0][0], json.loads(b''.join(chunks))
+
+
+def test_that_wsgi_routes_request_to_handler():
+    # Arrange.
+    application = create_api().wsgi()
+
+    # Act.
+    status, body = call_wsgi(application, 'GET', '/items/1', 'q=x')
+
+    # Assert.
+    assert status == '200 OK'
+    assert body == {'id': '1', 'q': 'x'}
+
+
+def test_that_wsgi_passes_request_body():
+    # Arrange.
+    application = create_api().wsgi()
+
+    # Act.
+    status, body = call_wsgi(application, 'PUT', '/items/1', body=b'{"a":1}')
+
+    # Assert.
+    assert body == {'a': 1}
+
+
+def test_that_wsgi_returns_errors():
+    # Arrange.
+    application = create_api().wsgi()
+
+    # Act.
+    statuses = [call_wsgi(application, 'GET', '/items/0')[0],
+                call_wsgi(application, 'GET', '/orders')[0],
+                call_wsgi(application, 'POST', '/items/1')[0]]
+
+    # Assert.
+    assert statuses == ['404 Not Found', '404 Not Found',
+                        '405 Method Not Allowed']
+
+
+def test_that_wsgi_passes_remote_address_as_source_ip():
+    # Arrange.
+    application = create_api().wsgi()
+
+    # Act.
+    _, body = call_wsgi(application, 'GET', '/client')
+
+    # Assert.
+    assert body == {'sourceIp': '127.0.0.1'}
+
+
+def test_that_asgi_routes_request_to_handler():
+    # Arrange.
+    application = create_api().asgi()
+    scope = {'type': 'http', 'method': 'GET', 'path': '/items/1',
+             'query_string': b'q=x', 'headers': []}
+    sent = []
+
+    async def receive(): return {'type': 'http.request', 'body': b''}
+    async def send(x): sent.append(x)
+
+    # Act.
+    asyncio.run(application(scope, receive, send))
+
+    # Assert.
+    assert sent[0]['status'] == 200
+    assert json.loads(sent[1]['body']) == {'id': '1', 'q': 'x'}
@@ -0,0 +1,154 @@
+import pytest
+from chalice.app import ConflictError, Response, UnprocessableEntityError
+
+from chalice_restful import Resource, idempotent
+from chalice_restful.caching import LruCache
+
+
+def create_request(key='1', body=b'{}'):
+    return {'method': 'POST',
+            'context': {'resourcePath': '/'},
+            'headers': {'idempotency-key': key} if key else {},
+            'raw_body': body}
+
+
+def create_resource(calls, **options):
+    class SimpleResource(Resource):
+        route = '/'
+
+        @idempotent(**options)
+        def post():
+            calls.append(1)
+            return Response(body={'id': len(calls)}, status_code=201)
+
+    return SimpleResource
+
+
+def test_that_retry_is_replayed_without_calling_handler(create_handler):
+    # Arrange.
+    calls = []
+    handler, _ = create_handler(create_resource(calls), create_request())
+
+    # Act.
+    first, retry = handler(), handler()
+
+    # Assert.
+    assert len(calls) == 1
+    assert first.body == {'id': 1}
+    assert retry.status_code == 201
+    assert retry.body == '{"id":1}'
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+
+
+def test_that_request_without_key_isnt_replayed(create_handler):
+    # Arrange.
+    calls = []
+    handler, _ = create_handler(create_resource(calls),
+                                create_request(key=None))
+
+    # Act.
+    handler(), handler()
+
+    # Assert.
+    assert len(calls) == 2
+
+
+def test_that_key_reused_with_different_body_is_rejected(create_handler):
+    # Arrange.
+    calls = []
+    handler, app = create_handler(create_resource(calls), create_request())
+
+    # Act.
+    handler()
+    app.current_request.raw_body = b'{"a":1}'
+
+    # Assert.
+    with pytest.raises(UnprocessableEntityError):
+        handler()
+
+
+def test_that_responses_are_kept_in_provided_store(create_api):
+    # Arrange.
+    calls = []
+    store = LruCache(max_entries=10, ttl=60)
+    first, _, first_route = create_api(create_request())
+    second, _, second_route = create_api(create_request())
+    first.add(create_resource(calls, store=store))
+    second.add(create_resource(calls, store=store))
+
+    # Act.
+    first_route.call_args[0][0]()
+    replayed = second_route.call_args[0][0]()
+
+    # Assert.
+    assert len(calls) == 1
+    assert len(store) == 1
+    assert replayed.headers['Idempotent-Replayed'] == 'true'
+
+
+def test_that_retry_of_request_in_progress_is_rejected(create_handler):
+    # Arrange.
+    calls, retries = [], []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @idempotent()
+        def post():
+            calls.append(1)
+            try:
+                handler()
+            except ConflictError as e:
+                retries.append(e)
+            return 'Response'
+
+    handler, _ = create_handler(SimpleResource, create_request())
+
+    # Act.
+    handler()
+
+    # Assert.
+    assert len(calls) == 1
+    assert len(retries) == 1
+
+
+def test_that_failed_request_can_be_retried(create_handler):
+    # Arrange.
+    calls = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @idempotent()
+        def post():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError('Error')
+            return 'Response'
+
+    handler, _ = create_handler(SimpleResource, create_request())
+
+    # Act.
+    with pytest.raises(ValueError):
+        handler()
+    response = handler()
+
+    # Assert.
+    assert response.body == 'Response'
+    assert len(calls) == 2
+
+
+def test_that_responses_arent_replayed_to_other_clients(create_handler):
+    # Arrange.
+    calls = []
+    handler, app = create_handler(create_resource(calls), create_request())
+
+    # Act.
+    app.current_request.context['authorizer'] = {'sub': 'a'}
+    handler()
+    app.current_request.context['authorizer'] = {'sub': 'b'}
+    response = handler()
+
+    # Assert.
+    assert len(calls) == 2
+    assert 'Idempotent-Replayed' not in response.headers
@@ -0,0 +1,128 @@
+import pytest
+
+from chalice_restful import Resource
+
+
+def test_that_cant_provide_unknown_scope(create_api):
+    # Arrange.
+    api, _, _ = create_api()
+
+    # Act.
+    provide = lambda: api.provide('client', object, scope='thread')
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        provide()
+
+
+def test_that_cant_provide_invalid_name(create_api):
+    # Arrange.
+    api, _, _ = create_api()
+
+    # Act.
+    provide = lambda: api.provide('http-client', object)
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        provide()
+
+
+def test_that_container_dependency_is_created_once(create_api):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        def get(id, client): return id, client
+
+    api, _, route = create_api()
+    api.add(SimpleResource)
+    api.provide('client', object)
+    handler = route.call_args[0][0]
+
+    # Act.
+    first, second = handler(id='1'), handler(id='2')
+
+    # Assert.
+    assert first[0] == '1' and second[0] == '2'
+    assert first[1] is second[1]
+
+
+def test_that_request_dependency_is_created_every_time(create_api):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(self, session): return session
+
+    api, _, route = create_api()
+    api.provide('session', object, scope='request')
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    first, second = handler(), handler()
+
+    # Assert.
+    assert first is not second
+
+
+def test_that_path_parameters_take_precedence_over_dependencies(create_api):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        def get(id): return id
+
+    api, _, route = create_api()
+    api.provide('id', lambda: 'Dependency')
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    response = handler(id='1')
+
+    # Assert.
+    assert response == '1'
+
+
+def test_that_dependencies_are_injected_into_validators(create_api):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        def etag(id, versions): return versions[id]
+
+        def get(id): return id
+
+    api, _, route = create_api()
+    api.provide('versions', lambda: {'1': 'v1'})
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    response = handler(id='1')
+
+    # Assert.
+    assert response.headers['ETag'] == '"v1"'
+
+
+def test_that_dependencies_are_injected_into_warm(create_api):
+    # Arrange.
+    warmed = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        def warm(client): warmed.append(client)
+
+        def get(): ...
+
+    api, _, _ = create_api()
+    api.provide('client', object)
+    api.add(SimpleResource)
+
+    # Act.
+    api.warm()
+
+    # Assert.
+    assert len(warmed) == 1 and warmed[0] is not None
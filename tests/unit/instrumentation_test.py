@@ -0,0 +1,129 @@
+import io
+import json
+
+import pytest
+from chalice.app import Response
+
+from chalice_restful import EmbeddedMetrics, Histogram, Measurement, Resource
+
+
+def test_that_instrumented_endpoint_is_measured(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return {'a': 1}
+
+    histogram = Histogram()
+    encode = lambda x: json.dumps(x, separators=(',', ':'))
+    handler, _ = create_handler(SimpleResource, instrumentation=histogram,
+                                json_encoder=encode)
+
+    # Act.
+    handler()
+
+    # Assert.
+    measurement = histogram.measurements[0]
+    assert (measurement.resource, measurement.route, measurement.method) == \
+        ('SimpleResource', '/', 'GET')
+    assert measurement.size == len('{"a":1}')
+    assert measurement.error is None
+    assert sum(histogram.counts[('SimpleResource', '/', 'GET')]) == 1
+
+
+def test_that_instrumented_endpoint_error_is_measured_and_raised(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): raise ValueError()
+
+    histogram = Histogram()
+    handler, _ = create_handler(SimpleResource, instrumentation=histogram)
+
+    # Act.
+    call = lambda: handler()
+
+    # Assert.
+    with pytest.raises(ValueError):
+        call()
+    assert histogram.measurements[0].error == 'ValueError'
+
+
+def test_that_only_first_invocation_is_cold(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return Response(body='Text')
+
+    measurements = []
+    handler, _ = create_handler(SimpleResource,
+                                instrumentation=measurements.append)
+
+    # Act.
+    handler()
+    handler()
+
+    # Assert.
+    assert not measurements[1].cold
+    assert measurements[1].size == 4
+
+
+def test_that_size_of_not_serialized_body_isnt_measured(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return {'a': 1}
+
+    measurements = []
+    handler, _ = create_handler(SimpleResource,
+                                instrumentation=measurements.append)
+
+    # Act.
+    handler()
+
+    # Assert.
+    assert measurements[0].size is None
+
+
+def test_that_embedded_metrics_prints_metric_line(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): ...
+
+    stream = io.StringIO()
+    handler, _ = create_handler(
+        SimpleResource, instrumentation=EmbeddedMetrics('Test', stream=stream))
+
+    # Act.
+    handler()
+
+    # Assert.
+    line = json.loads(stream.getvalue())
+    assert line['_aws']['CloudWatchMetrics'][0]['Namespace'] == 'Test'
+    assert line['Resource'] == 'SimpleResource'
+    assert line['Method'] == 'GET'
+    assert line['Errors'] == 0
+
+
+def test_that_embedded_metrics_omits_unknown_response_size():
+    # Arrange.
+    stream = io.StringIO()
+    sink = EmbeddedMetrics('Test', stream=stream)
+
+    # Act.
+    sink(Measurement('Items', '/', 'GET', 0.1, None, None, False))
+    sink(Measurement('Items', '/', 'GET', 0.1, 10, None, False))
+
+    # Assert.
+    unknown, known = [json.loads(x) for x in stream.getvalue().splitlines()]
+    names = lambda x: [y['Name'] for y in
+                       x['_aws']['CloudWatchMetrics'][0]['Metrics']]
+    assert 'ResponseSize' not in unknown
+    assert 'ResponseSize' not in names(unknown)
+    assert known['ResponseSize'] == 10
+    assert 'ResponseSize' in names(known)
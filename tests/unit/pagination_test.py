@@ -0,0 +1,151 @@
+import json
+
+import pytest
+from chalice.app import BadRequestError
+
+from chalice_restful import Resource, paginated
+
+
+def test_that_paginated_endpoint_returns_first_page(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @paginated(limit=2)
+        def get(): return iter(range(5))
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Act.
+    page = json.loads(handler().body)
+
+    # Assert.
+    assert page['items'] == [0, 1]
+    assert page['next'] is not None
+
+
+def test_that_paginated_endpoint_returns_next_page_by_cursor(create_handler):
+    # Arrange.
+    @paginated(limit=2)
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get():
+            for x in range(5):
+                yield x
+
+    handler, app = create_handler(SimpleResource)
+    pages = [json.loads(handler().body)]
+
+    # Act.
+    while pages[-1]['next']:
+        app.current_request.query_params = {'cursor': pages[-1]['next']}
+        pages.append(json.loads(handler().body))
+
+    # Assert.
+    assert [x['items'] for x in pages] == [[0, 1], [2, 3], [4]]
+
+
+def test_that_paginated_endpoint_respects_limit_parameter(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @paginated(max_limit=3)
+        def get(): return iter(range(5))
+
+    handler, app = create_handler(SimpleResource,
+                                  {'query_params': {'limit': '3'}})
+
+    # Act.
+    page = json.loads(handler().body)
+    app.current_request.query_params = {'limit': '4'}
+    call = lambda: handler()
+
+    # Assert.
+    assert page['items'] == [0, 1, 2]
+    with pytest.raises(BadRequestError):
+        call()
+
+
+def test_that_paginated_page_ends_before_exceeding_max_bytes(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @paginated(max_bytes=100)
+        def get(): return iter(['x' * 10] * 10)
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert len(response.body) <= 100
+    assert json.loads(response.body)['next'] is not None
+
+
+def test_that_paginated_endpoint_accepts_async_generator(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @paginated()
+        async def get():
+            for x in range(3):
+                yield x
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Act.
+    page = json.loads(handler().body)
+
+    # Assert.
+    assert page == {'items': [0, 1, 2], 'next': None}
+
+
+def test_that_paginated_endpoint_rejects_invalid_cursor(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @paginated()
+        def get(): return iter(range(3))
+
+    handler, _ = create_handler(SimpleResource,
+                                {'query_params': {'cursor': '!'}})
+
+    # Act.
+    call = lambda: handler()
+
+    # Assert.
+    with pytest.raises(BadRequestError):
+        call()
+
+
+def test_that_paginated_endpoint_resumes_from_cursor(create_handler):
+    # Arrange.
+    cursors = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @paginated(limit=2)
+        def get(cursor):
+            cursors.append(cursor)
+            start = 0 if cursor is None else cursor['after'] + 1
+            for x in range(start, 5):
+                yield {'after': x}, x
+
+    handler, app = create_handler(SimpleResource)
+    pages = [json.loads(handler().body)]
+
+    # Act.
+    while pages[-1]['next']:
+        app.current_request.query_params = {'cursor': pages[-1]['next']}
+        pages.append(json.loads(handler().body))
+
+    # Assert.
+    assert [x['items'] for x in pages] == [[0, 1], [2, 3], [4]]
+    assert cursors == [None, {'after': 1}, {'after': 3}]
@@ -0,0 +1,158 @@
+import pytest
+
+from chalice_restful import LocalBuckets, Resource, rate_limit
+
+
+class Clock:
+    def __init__(self): self.now = 0
+    def __call__(self): return self.now
+
+
+def create_request(source_ip='1.1.1.1'):
+    return {'context': {'identity': {'sourceIp': source_ip}}}
+
+
+def test_that_rate_limit_config_cant_have_unknown_key():
+    # Arrange.
+    def fake(): ...
+
+    # Act.
+    decorate = lambda: rate_limit(per_second=1, key='user')(fake)
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        decorate()
+
+
+def test_that_bucket_allows_burst_and_refills():
+    # Arrange.
+    clock = Clock()
+    buckets = LocalBuckets(clock=clock)
+
+    # Act.
+    burst = [buckets.take('a', 2, 3) for _ in range(4)]
+    clock.now = 0.5
+    refilled = [buckets.take('a', 2, 3) for _ in range(2)]
+
+    # Assert.
+    assert burst == [0, 0, 0, 0.5]
+    assert refilled == [0, 0.5]
+
+
+def test_that_least_recently_used_bucket_is_evicted():
+    # Arrange.
+    buckets = LocalBuckets(max_entries=2, clock=Clock())
+
+    # Act.
+    for x in ('a', 'b', 'a', 'c'):
+        buckets.take(x, 1, 1)
+
+    # Assert.
+    assert list(buckets.buckets) == ['a', 'c']
+
+
+def test_that_excess_requests_are_rejected_before_handler(create_handler):
+    # Arrange.
+    calls = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @rate_limit(per_second=1, burst=2)
+        def get():
+            calls.append(1)
+            return 'Response'
+
+    handler, app = create_handler(SimpleResource, create_request())
+
+    # Act.
+    responses = [handler() for _ in range(3)]
+
+    # Assert.
+    assert responses[:2] == ['Response', 'Response']
+    assert responses[2].status_code == 429
+    assert responses[2].headers['Retry-After'] == '1'
+    assert len(calls) == 2
+
+
+def test_that_clients_are_limited_separately(create_handler):
+    # Arrange.
+    @rate_limit(per_second=1, key=lambda x: x.headers['x-client'])
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return 'Response'
+
+    handler, app = create_handler(SimpleResource, create_request())
+
+    # Act.
+    responses = []
+    for x in ('a', 'b', 'a'):
+        app.current_request.headers = {'x-client': x}
+        responses.append(handler())
+
+    # Assert.
+    assert responses[:2] == ['Response', 'Response']
+    assert responses[2].status_code == 429
+
+
+def test_that_source_ip_ignores_headers_sent_by_client(create_handler):
+    # Arrange.
+    @rate_limit(per_second=1)
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return 'Response'
+
+    handler, app = create_handler(SimpleResource,
+                                  create_request(source_ip=None))
+
+    # Act.
+    responses = []
+    for x in ('1.1.1.1', '2.2.2.2'):
+        app.current_request.headers = {'x-forwarded-for': x, 'x-api-key': x}
+        responses.append(handler())
+
+    # Assert.
+    assert [x.status_code for x in responses] == [403, 403]
+
+
+def test_that_forwarded_for_key_uses_address_added_by_proxy(create_handler):
+    # Arrange.
+    @rate_limit(per_second=1, key='forwarded_for')
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return 'Response'
+
+    handler, app = create_handler(SimpleResource)
+
+    # Act.
+    responses = []
+    for x in ('0.0.0.0, 1.1.1.1', '2.2.2.2', '3.3.3.3, 1.1.1.1'):
+        app.current_request.headers = {'x-forwarded-for': x}
+        responses.append(handler())
+
+    # Assert.
+    assert responses[:2] == ['Response', 'Response']
+    assert responses[2].status_code == 429
+
+
+def test_that_unidentified_client_is_rejected(create_handler):
+    # Arrange.
+    calls = []
+
+    @rate_limit(per_second=1, key='api_key')
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): calls.append(1)
+
+    handler, _ = create_handler(SimpleResource, create_request())
+
+    # Act.
+    response = handler()
+
+    # Assert.
+    assert response.status_code == 403
+    assert calls == []
@@ -0,0 +1,72 @@
+import pytest
+from chalice.app import MethodNotAllowedError, NotFoundError
+
+from chalice_restful.routing import Route, RouteTable
+
+
+def create_table(*paths):
+    table = RouteTable()
+    for x in paths:
+        table.add(Route(x, 'GET', lambda **_: x, {}))
+
+    return table
+
+
+def test_that_static_path_is_matched():
+    # Arrange.
+    table = create_table('/', '/items', '/items/{id}')
+
+    # Act.
+    routes, params = table.match('/items')
+
+    # Assert.
+    assert routes['GET'].path == '/items'
+    assert params == {}
+
+
+def test_that_path_parameters_are_matched():
+    # Arrange.
+    table = create_table('/items/{id}', '/items/{id}/tags/{tag}')
+
+    # Act.
+    routes, params = table.match('/items/1/tags/x')
+
+    # Assert.
+    assert routes['GET'].path == '/items/{id}/tags/{tag}'
+    assert params == {'id': '1', 'tag': 'x'}
+
+
+def test_that_static_segment_takes_precedence_over_parameter():
+    # Arrange.
+    table = create_table('/items/{id}', '/items/new', '/items/{id}/edit')
+
+    # Act.
+    new, _ = table.match('/items/new')
+    edit, params = table.match('/items/new/edit')
+
+    # Assert.
+    assert new['GET'].path == '/items/new'
+    assert edit['GET'].path == '/items/{id}/edit'
+    assert params == {'id': 'new'}
+
+
+def test_that_missing_path_isnt_matched():
+    # Arrange.
+    table = create_table('/items/{id}')
+
+    # Act.
+    matched = [table.match(x) for x in ('/items', '/items/1/x', '/orders')]
+
+    # Assert.
+    assert matched == [None, None, None]
+
+
+def test_that_resolve_raises_not_found_and_method_not_allowed():
+    # Arrange.
+    table = create_table('/items')
+
+    # Assert.
+    with pytest.raises(NotFoundError):
+        table.resolve('GET', '/orders')
+    with pytest.raises(MethodNotAllowedError):
+        table.resolve('POST', '/items')
@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from chalice.app import Response
+
+from chalice_restful import Resource, encode_json
+from chalice_restful import serialization
+
+
+@dataclass
+class Item:
+    price: Decimal
+    created: datetime
+
+
+VALUE = {'item': Item(Decimal('1.5'), datetime(2020, 1, 2, 3, 4, 5)),
+         'count': Decimal('2')}
+EXPECTED = {'item': {'price': 1.5, 'created': '2020-01-02T03:04:05'},
+            'count': 2}
+
+
+def test_that_encode_json_supports_extra_types():
+    # Act.
+    encoded = encode_json(VALUE)
+
+    # Assert.
+    assert json.loads(encoded) == EXPECTED
+
+
+def test_that_encode_json_supports_extra_types_without_orjson(monkeypatch):
+    # Arrange.
+    monkeypatch.setattr(serialization, 'orjson', None)
+
+    # Act.
+    encoded = encode_json(VALUE)
+
+    # Assert.
+    assert json.loads(encoded) == EXPECTED
+
+
+def test_that_encode_json_supports_large_integers_and_not_str_keys():
+    # Arrange.
+    value = {1: Decimal(2 ** 70)}
+
+    # Act.
+    encoded = encode_json(value)
+
+    # Assert.
+    assert json.loads(encoded) == {'1': 2 ** 70}
+
+
+def test_that_orjson_isnt_imported_with_package():
+    # Arrange.
+    script = 'import sys, chalice_restful; print("orjson" in sys.modules)'
+
+    root = os.path.dirname(os.path.dirname(serialization.__file__))
+
+    # Act.
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=root)
+
+    # Assert.
+    assert output.strip() == b'False'
+
+
+def test_that_encode_json_cant_encode_unknown_type():
+    # Act.
+    encode = lambda: encode_json(object())
+
+    # Assert.
+    with pytest.raises(TypeError):
+        encode()
+
+
+def test_that_responses_are_serialized_by_api_json_encoder(create_api):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return {'a': 1}
+        def post(): return Response(body=[1], status_code=201)
+        def put(): return 'Text'
+
+    api, _, route = create_api(json_encoder=lambda x: f'Encoded {x}')
+    api.add(SimpleResource)
+    get, post, put = [x[0][0] for x in route.call_args_list]
+
+    # Act.
+    responses = [get(), post(), put()]
+
+    # Assert.
+    assert responses[0].body == "Encoded {'a': 1}"
+    assert (responses[1].body, responses[1].status_code) == ('Encoded [1]', 201)
+    assert responses[2] == 'Text'
@@ -0,0 +1,226 @@
+import asyncio
+import json
+from threading import Event
+from time import sleep
+
+import pytest
+from chalice import Chalice
+from chalice.config import Config
+from chalice.local import LocalGateway
+from mock import MagicMock
+
+from chalice_restful import Api, Resource, timeout
+from chalice_restful.timeouts import (Deadline, GatewayTimeoutError,
+                                      ServiceUnavailableError)
+
+
+def create_context(remaining_ms):
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = remaining_ms
+
+    return context
+
+
+def test_that_timeout_config_should_be_positive():
+    # Arrange.
+    def fake(): ...
+
+    # Act.
+    decorate = lambda: timeout(0)(fake)
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        decorate()
+
+
+def test_that_deadline_counts_remaining_time():
+    # Arrange.
+    now = [10]
+    deadline = Deadline.after(5, clock=lambda: now[0])
+
+    # Act.
+    before = deadline.remaining()
+    now[0] = 20
+
+    # Assert.
+    assert before == 5
+    assert deadline.remaining() == 0
+    assert deadline.expired
+
+
+def test_that_deadline_is_lambda_remaining_time_without_timeout(create_api):
+    # Arrange.
+    api, app, _ = create_api()
+    app.lambda_context = create_context(3000)
+    no_lambda, _, _ = create_api()
+
+    # Act.
+    remaining = api.deadline.remaining()
+
+    # Assert.
+    assert 2.9 < remaining <= 3
+    assert no_lambda.deadline is None
+
+
+def test_that_endpoint_gets_deadline_of_timeout(create_api):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(2)
+        def get(): return api.deadline.remaining()
+
+    api, app, route = create_api()
+    app.lambda_context = create_context(10000)
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    remaining = handler()
+
+    # Assert.
+    assert 1.9 < remaining <= 2
+
+
+def test_that_slow_endpoint_times_out(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(0.05)
+        def get(): sleep(1)
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Assert.
+    with pytest.raises(GatewayTimeoutError):
+        handler()
+
+
+def test_that_endpoint_errors_are_propagated(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(1)
+        def get(): raise ValueError('Error')
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Assert.
+    with pytest.raises(ValueError):
+        handler()
+
+
+def test_that_timed_out_endpoint_keeps_its_request(create_api):
+    # Arrange.
+    seen, release = [], Event()
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(0.05)
+        def get():
+            release.wait(1)
+            seen.append(api.request)
+
+    api, app, route = create_api()
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+    first = app.current_request
+
+    # Act.
+    with pytest.raises(GatewayTimeoutError):
+        handler()
+    app.current_request = MagicMock()
+    release.set()
+    sleep(0.1)
+
+    # Assert.
+    assert seen == [first]
+
+
+def test_that_request_without_time_left_is_rejected(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(1)
+        def get(): return 'Response'
+
+    handler, app = create_handler(SimpleResource)
+    app.lambda_context = create_context(0)
+
+    # Assert.
+    with pytest.raises(ServiceUnavailableError):
+        handler()
+
+
+def test_that_async_endpoint_runs_on_shared_loop(create_api):
+    # Arrange.
+    loops = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(1)
+        async def get():
+            loops.append(asyncio.get_running_loop())
+            return api.deadline.remaining()
+
+    api, _, route = create_api()
+    api.add(SimpleResource)
+    handler = route.call_args[0][0]
+
+    # Act.
+    remaining = [handler() for _ in range(3)]
+
+    # Assert.
+    assert len(set(loops)) == 1
+    assert all(0.9 < x <= 1 for x in remaining)
+    assert api.deadline is None
+
+
+def test_that_slow_async_endpoint_is_cancelled(create_handler):
+    # Arrange.
+    cancelled = []
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(0.05)
+        async def get():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+    handler, _ = create_handler(SimpleResource)
+
+    # Assert.
+    with pytest.raises(GatewayTimeoutError):
+        handler()
+    assert cancelled == [1]
+
+
+def test_that_timeout_works_locally_without_lambda_timeout():
+    # Arrange.
+    app = Chalice('test', configure_logs=False)
+    api = Api(app)
+
+    class SimpleResource(Resource):
+        route = '/'
+
+        @timeout(1)
+        def get(): return {'remaining': api.deadline.remaining()}
+
+    api.add(SimpleResource)
+    gateway = LocalGateway(app, Config())
+
+    # Act.
+    response = gateway.handle_request('GET', '/', {}, '')
+
+    # Assert.
+    assert response['statusCode'] == 200
+    assert 0.9 < json.loads(response['body'])['remaining'] <= 1
@@ -0,0 +1,119 @@
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Optional
+
+import pytest
+from chalice.app import BadRequestError
+
+from chalice_restful import Resource, body
+from chalice_restful.validation import compile_schema
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+    count: int = 0
+    tags: List[Tag] = field(default_factory=list)
+    note: Optional[str] = None
+
+
+class Point(NamedTuple):
+    x: int
+    y: int = 0
+
+
+def test_that_body_cant_have_not_schema_type():
+    # Arrange.
+    def fake(): ...
+
+    # Act.
+    decorate = lambda: body(dict)(fake)
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        decorate()
+
+
+def test_that_valid_body_is_converted_to_schema():
+    # Arrange.
+    validate = compile_schema(Item)
+
+    # Act.
+    item = validate({'name': 'a', 'price': 1, 'tags': [{'name': 'b'}]})
+
+    # Assert.
+    assert item == Item(name='a', price=1, tags=[Tag(name='b')])
+
+
+def test_that_named_tuple_body_is_converted_to_schema():
+    # Arrange.
+    validate = compile_schema(Point)
+
+    # Act.
+    point = validate({'x': 1})
+
+    # Assert.
+    assert point == Point(x=1, y=0)
+
+
+def test_that_invalid_body_reports_all_errors():
+    # Arrange.
+    validate = compile_schema(Item)
+
+    # Act.
+    call = lambda: validate({'price': 'x', 'count': True, 'tags': [{}]})
+
+    # Assert.
+    with pytest.raises(BadRequestError) as e:
+        call()
+    assert 'body.name to be present' in str(e.value)
+    assert 'body.price to be of type float' in str(e.value)
+    assert 'body.count to be of type int' in str(e.value)
+    assert 'body.tags[0].name to be present' in str(e.value)
+
+
+def test_that_validated_body_is_passed_to_endpoint(create_handler):
+    # Arrange.
+    class SimpleResource(Resource):
+        route = '/{id}'
+
+        @body(Point)
+        def post(id, body): return id, body
+
+    handler, _ = create_handler(SimpleResource,
+                                {'json_body': {'x': 1, 'y': 2}})
+
+    # Act.
+    response = handler(id='1')
+
+    # Assert.
+    assert response == ('1', Point(x=1, y=2))
+
+
+def test_that_body_of_resource_doesnt_affect_get(create_api):
+    # Arrange.
+    @body(Point)
+    class SimpleResource(Resource):
+        route = '/'
+
+        def get(): return 'got'
+
+        def post(body): return body
+
+    api, app, route = create_api({'json_body': None})
+    api.add(SimpleResource)
+    methods = [x[1]['methods'][0] for x in app.route.call_args_list]
+    handlers = dict(zip(methods, (x[0][0] for x in route.call_args_list)))
+
+    # Act.
+    response = handlers['GET']()
+
+    # Assert.
+    assert response == 'got'
+    with pytest.raises(BadRequestError):
+        handlers['POST']()
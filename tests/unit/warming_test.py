@@ -0,0 +1,96 @@
+import pytest
+from mock import MagicMock
+
+from chalice_restful import Api, Resource
+from chalice_restful.warming import is_warm_up
+
+SCHEDULED = {'source': 'aws.events', 'detail-type': 'Scheduled Event'}
+
+
+def test_that_scheduled_event_is_warm_up():
+    # Act.
+    matched = is_warm_up(SCHEDULED, header=None)
+
+    # Assert.
+    assert matched
+
+
+def test_that_request_with_marker_header_is_warm_up():
+    # Arrange.
+    marked = {'headers': {'x-warm-up': 'secret'}}
+    unmarked = {'headers': {'accept': '*/*'}}
+
+    # Act.
+    matched = [is_warm_up(marked, 'X-Warm-Up', 'secret'),
+               is_warm_up(unmarked, 'X-Warm-Up', 'secret'),
+               is_warm_up(marked, None, 'secret')]
+
+    # Assert.
+    assert matched == [True, False, False]
+
+
+def test_that_request_without_secret_isnt_warm_up():
+    # Arrange.
+    forged = {'headers': {'x-warm-up': '1'}}
+
+    # Act.
+    matched = [is_warm_up(forged, 'X-Warm-Up', 'secret'),
+               is_warm_up(forged, 'X-Warm-Up', None)]
+
+    # Assert.
+    assert matched == [False, False]
+
+
+def test_that_cant_use_marker_header_without_secret():
+    # Act.
+    create = lambda: Api(MagicMock(), warm_up_header='X-Warm-Up')
+
+    # Assert.
+    with pytest.raises(AssertionError):
+        create()
+
+
+def test_that_warm_up_ping_warms_resources_without_routing():
+    # Arrange.
+    warmed = []
+
+    class Items(Resource):
+        route = '/items'
+
+        def setup(self): warmed.append('setup')
+        def warm(self): warmed.append('warm')
+        def get(self): ...
+        def post(self): ...
+
+    class Orders(Resource):
+        route = '/orders'
+
+        def warm(): raise ValueError('Error')
+        def get(): ...
+
+    app = MagicMock()
+    api = Api(app)
+    api.add(Items)
+    api.add(Orders)
+
+    # Act.
+    response = api.lambda_handler(SCHEDULED, None)
+
+    # Assert.
+    assert response['statusCode'] == 204
+    assert warmed == ['setup', 'warm']
+    app.assert_not_called()
+
+
+def test_that_other_events_are_passed_to_chalice():
+    # Arrange.
+    app = MagicMock(return_value='Response')
+    api = Api(app, warm_up_header='X-Warm-Up', warm_up_secret='secret')
+    event = {'headers': {'x-warm-up': '1'}}
+
+    # Act.
+    response = api.lambda_handler(event, 'context')
+
+    # Assert.
+    assert response == 'Response'
+    app.assert_called_once_with(event, 'context')